@@ -1,61 +1,115 @@
 # generator/cli.py
 
-import argparse
+import functools
+import heapq
+import os
+import re
 import sys
 from pathlib import Path
-from typing import List
-from code_generator import (
-    CodeGenerator,
-    GeneratorConfig,
-    PropertyConfig,
-    ValidationRule,
-    ValidationType
+from typing import TYPE_CHECKING, Callable, Iterable, List, Literal, Optional, Tuple
+
+# Os módulos argparse e code_generator só são importados quando um comando é
+# executado, mantendo rápidos o --help e os erros de argumentos
+if TYPE_CHECKING:
+    import argparse
+    from code_generator import GeneratorConfig, PropertyConfig
+
+# Tipos ArkTS aceitos para propriedades
+_VALID_TYPES = frozenset({'string', 'number', 'boolean', 'Date'})
+_VALID_TYPES_STR = 'string, number, boolean, Date'
+
+# Rótulos para flags booleanas, indexados por int(flag)
+_YN = ('Não', 'Sim')
+
+# Blocos de texto do relatório, preenchidos com format_map
+_SUMMARY_TMPL = (
+    "\n" + "="*60 + "\n"
+    "📊 Resumo da configuração:\n"
+    + "="*60 + "\n"
+    "  Entidade: {entity}\n"
+    "  Arquitetura: {arch}\n"
+    "  Propriedades: {count}\n"
+    "{props}\n"
+    "  Cache: {cache}\n"
+    "  Validação: {validation}\n"
+    "  Output: {output}\n"
+    + "="*60 + "\n"
 )
 
+_NEXT_STEPS_TMPL = (
+    "\n💡 Próximos passos:\n"
+    "  1. Revise os arquivos gerados em: {output}\n"
+    "  2. Ajuste o BaseURL nas datasources\n"
+    "  3. Configure o AppContainer para injeção de dependências\n"
+    "  4. Implemente a BaseViewModel se necessário\n\n"
+)
+
+# Propriedade no formato "nome:tipo" ou "nome:tipo?"
+_PROP_RE = re.compile(r'\s*([A-Za-z_]\w*)\s*:\s*(string|number|boolean|Date)\s*(\?)?\s*')
+
+# Ajuda geral, exibida sem construir o parser (mesmo conteúdo gerado pelo argparse)
+_STATIC_HELP = '''usage: {prog} [-h] {{generate,g,interactive,i}} ...
+
+🚀 ArkTS Code Generator - Clean Architecture & MVVM
+
+positional arguments:
+  {{generate,g,interactive,i}}
+                        Comandos disponíveis
+    generate (g)        Gera código ArkTS
+    interactive (i)     Modo interativo
+
+options:
+  -h, --help            show this help message and exit
 
-class GeneratorCLI:
-    """Interface de linha de comando para o gerador de código ArkTS"""
-    
-    @staticmethod
-    def run():
-        """Executa o CLI"""
-        parser = argparse.ArgumentParser(
-            description='🚀 ArkTS Code Generator - Clean Architecture & MVVM',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog='''
 Exemplos de uso:
   # Clean Architecture com cache e validações
   python -m generator.cli generate User --props "name:string,email:string,age:number" --cache --validation
-  
+
   # MVVM Tradicional
   python -m generator.cli generate Product --arch mvvm --props "name:string,price:number"
-  
+
   # Propriedades opcionais (adicione ? no final do tipo)
   python -m generator.cli g User --props "name:string,bio:string?"
-  
+
   # Modo interativo
   python -m generator.cli interactive
-            '''
-        )
+'''
+
+
+class GeneratorCLI:
+    """Interface de linha de comando para o gerador de código ArkTS"""
+    
+    @staticmethod
+    def run():
+        """Executa o CLI"""
+        if len(sys.argv) == 1 or sys.argv[1] in ('-h', '--help'):
+            GeneratorCLI._print_help()
+            return
+        
+        import argparse
+        
+        # A ajuda geral é estática, então o parser não precisa de descrição,
+        # epílogo nem da ação de ajuda padrão
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument('-h', '--help', action='store_true')
         
         subparsers = parser.add_subparsers(dest='command', help='Comandos disponíveis')
         
         # Comando generate
         gen_parser = subparsers.add_parser('generate', aliases=['g'], help='Gera código ArkTS')
-        gen_parser.add_argument('entity', help='Nome da entidade (ex: User, Product)')
-        gen_parser.add_argument('--props', required=True, help='Propriedades (formato: name:string,email:string)')
-        gen_parser.add_argument('--arch', choices=['mvvm', 'clean'], default='clean', help='Arquitetura (padrão: clean)')
-        gen_parser.add_argument('--cache', action='store_true', help='Incluir cache local')
-        gen_parser.add_argument('--validation', action='store_true', help='Incluir validações')
-        gen_parser.add_argument('--output', default='./generated', help='Diretório de saída (padrão: ./generated)')
         
         # Comando interactive
         subparsers.add_parser('interactive', aliases=['i'], help='Modo interativo')
         
+        # Argumentos só são registrados para o subcomando invocado; os demais
+        # subcomandos só precisam existir para validar a escolha
+        if sys.argv[1:2] in (['generate'], ['g']):
+            GeneratorCLI._build_generate(gen_parser)
+        
         args = parser.parse_args()
         
-        if not args.command:
-            parser.print_help()
+        if args.help or not args.command:
+            GeneratorCLI._print_help()
             return
         
         if args.command in ['generate', 'g']:
@@ -63,48 +117,66 @@ Exemplos de uso:
         elif args.command in ['interactive', 'i']:
             GeneratorCLI._interactive_mode()
     
+    @staticmethod
+    def _print_help():
+        """Exibe a ajuda geral do CLI"""
+        sys.stdout.write(_STATIC_HELP.format(prog=os.path.basename(sys.argv[0])))
+    
+    @staticmethod
+    def _build_generate(gen_parser: 'argparse.ArgumentParser'):
+        """Registra os argumentos do comando generate"""
+        gen_parser.add_argument('entity', help='Nome da entidade (ex: User, Product)')
+        gen_parser.add_argument('--props', required=True, help='Propriedades (formato: name:string,email:string)')
+        gen_parser.add_argument('--arch', choices=['mvvm', 'clean'], default='clean', help='Arquitetura (padrão: clean)')
+        gen_parser.add_argument('--cache', action='store_true', help='Incluir cache local')
+        gen_parser.add_argument('--validation', action='store_true', help='Incluir validações')
+        gen_parser.add_argument('--output', default='./generated', help='Diretório de saída (padrão: ./generated)')
+    
     @staticmethod
     def _generate_from_args(args):
         """Gera código ArkTS a partir dos argumentos"""
+        from code_generator import CodeGenerator
+        
         try:
             config = GeneratorCLI._parse_config(args)
             
-            print(f"\n🎯 Gerando código ArkTS para: {config.entity_name}")
-            print(f"📐 Arquitetura: {config.architecture.upper()}")
-            print(f"💾 Cache: {'Sim' if config.include_cache else 'Não'}")
-            print(f"✅ Validação: {'Sim' if config.include_validation else 'Não'}")
-            print(f"📝 Propriedades: {len(config.properties)}")
+            sys.stdout.write('\n'.join([
+                f"\n🎯 Gerando código ArkTS para: {config.entity_name}",
+                f"📐 Arquitetura: {config.architecture.upper()}",
+                f"💾 Cache: {_YN[config.include_cache]}",
+                f"✅ Validação: {_YN[config.include_validation]}",
+                f"📝 Propriedades: {len(config.properties)}",
+            ]) + '\n')
             
             generator = CodeGenerator(config)
-            files = generator.generate_all()
+            out_abs, files = GeneratorCLI._write_files(generator.iter_files(), args.output)
             
-            GeneratorCLI._write_files(files, args.output)
-            
-            print(f"\n✅ {len(files)} arquivos gerados com sucesso!")
-            print(f"📁 Localização: {Path(args.output).absolute()}\n")
+            out = [
+                f"\n✅ {len(files)} arquivos gerados com sucesso!",
+                f"📁 Localização: {out_abs}\n",
+                "📄 Arquivos criados:",
+            ]
             
             # Lista arquivos gerados
-            print("📄 Arquivos criados:")
-            for path in sorted(files.keys()):
-                print(f"  ✓ {path}")
+            out.extend(f"  ✓ {path}" for path in sorted(files))
             
-            print(f"\n💡 Próximos passos:")
-            print(f"  1. Revise os arquivos gerados em: {args.output}")
-            print(f"  2. Ajuste o BaseURL nas datasources")
-            print(f"  3. Configure o AppContainer para injeção de dependências")
-            print(f"  4. Implemente a BaseViewModel se necessário\n")
+            out.append(_NEXT_STEPS_TMPL.format_map({'output': args.output}))
+            sys.stdout.write('\n'.join(out))
             
         except Exception as e:
             print(f"\n❌ Erro ao gerar código: {str(e)}\n", file=sys.stderr)
             sys.exit(1)
     
     @staticmethod
-    def _parse_config(args) -> GeneratorConfig:
+    def _parse_config(args) -> 'GeneratorConfig':
         """Converte argumentos em configuração"""
+        from code_generator import GeneratorConfig, PropertyConfig
+        
         properties = GeneratorCLI._parse_properties(args.props)
         
         # Adiciona ID automaticamente se não existir
-        if not any(p.name == 'id' for p in properties):
+        names = {p.name for p in properties}
+        if 'id' not in names:
             properties.insert(0, PropertyConfig(
                 name='id',
                 type='number',
@@ -120,90 +192,164 @@ Exemplos de uso:
         )
     
     @staticmethod
-    def _parse_properties(props_string: str) -> List[PropertyConfig]:
+    def _parse_properties(props_string: str) -> List['PropertyConfig']:
         """Parse string de propriedades para ArkTS"""
-        properties = []
+        from code_generator import PropertyConfig
+        
+        specs, warnings = GeneratorCLI._parse_properties_cached(props_string)
+        for warning in warnings:
+            print(warning)
+        
+        return [
+            PropertyConfig(name=name, type=type_str, optional=optional)
+            for name, type_str, optional in specs
+        ]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _parse_properties_cached(props_string: str) -> Tuple[Tuple[Tuple[str, str, bool], ...], Tuple[str, ...]]:
+        """Parse memoizado: retorna (nome, tipo, opcional) de cada propriedade e os avisos gerados"""
+        specs = []
+        warnings = []
+        names = set()
         
         for prop in props_string.split(','):
-            prop = prop.strip()
-            if ':' not in prop:
-                print(f"⚠️  Propriedade inválida ignorada: {prop}")
+            spec = GeneratorCLI._parse_one_prop(prop)
+            if spec is None:
+                invalid_type = GeneratorCLI._invalid_prop_type(prop)
+                if invalid_type:
+                    name, type_str = invalid_type
+                    warnings.append(f"⚠️  Tipo inválido '{type_str}' para propriedade '{name}'. Use: {_VALID_TYPES_STR}")
+                else:
+                    warnings.append(f"⚠️  Propriedade inválida ignorada: {prop.strip()}")
                 continue
             
-            name, type_str = prop.split(':', 1)
-            name = name.strip()
-            type_str = type_str.strip()
-            
-            # Verifica se é opcional
-            optional = False
-            if type_str.endswith('?'):
-                optional = True
-                type_str = type_str[:-1].strip()
-            
-            # Valida tipo ArkTS
-            valid_types = ['string', 'number', 'boolean', 'Date']
-            if type_str not in valid_types:
-                print(f"⚠️  Tipo inválido '{type_str}' para propriedade '{name}'. Use: {', '.join(valid_types)}")
+            if spec[0] in names:
+                warnings.append(f"⚠️  Propriedade duplicada ignorada: {spec[0]}")
                 continue
-            
-            properties.append(PropertyConfig(
-                name=name,
-                type=type_str,
-                optional=optional
-            ))
+            names.add(spec[0])
+            specs.append(spec)
         
-        return properties
+        return tuple(specs), tuple(warnings)
     
     @staticmethod
-    def _write_files(files: dict, output_dir: str):
-        """Escreve arquivos ArkTS no sistema"""
-        base_path = Path(output_dir)
+    def _parse_one_prop(raw: str) -> Optional[Tuple[str, str, bool]]:
+        """Parse de uma propriedade 'nome:tipo' ou 'nome:tipo?'; retorna None se inválida"""
+        match = _PROP_RE.fullmatch(raw)
+        if not match:
+            return None
+        name, type_str, optional = match.groups()
+        return name, type_str, optional is not None
+    
+    @staticmethod
+    def _invalid_prop_type(raw: str) -> Optional[Tuple[str, str]]:
+        """Para uma propriedade inválida, retorna (nome, tipo) se o problema for o tipo"""
+        name, sep, type_str = raw.strip().partition(':')
+        if not sep:
+            return None
         
-        for file_path, content in files.items():
-            full_path = base_path / file_path
-            
-            # Cria diretórios
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+        type_str = type_str.strip()
+        if type_str.endswith('?'):
+            type_str = type_str[:-1].strip()
+        
+        # Valida tipo ArkTS
+        if type_str in _VALID_TYPES:
+            return None
+        return name.strip(), type_str
+    
+    @staticmethod
+    def _write_files(files: Iterable[Tuple[str, str]], output_dir: str) -> Tuple[Path, List[str]]:
+        """Escreve arquivos ArkTS à medida que são gerados; retorna a saída absoluta e os arquivos escritos"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        base_path = Path(output_dir).absolute()
+        base = os.fspath(base_path)
+        created_dirs = set()
+        written = []
+        
+        def write(full_path: str, data: bytes):
+            with open(full_path, 'wb') as f:
+                f.write(data)
+        
+        # Cada arquivo é enviado para escrita assim que é gerado, mantendo em
+        # memória apenas os conteúdos ainda não escritos. Caminhos são montados
+        # com os.path, evitando criar objetos Path por arquivo
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pending = []
+            for file_path, content in files:
+                full_path = os.path.join(base, file_path)
+                
+                # Cria cada diretório uma única vez
+                directory = os.path.dirname(full_path)
+                if directory not in created_dirs:
+                    os.makedirs(directory, exist_ok=True)
+                    created_dirs.add(directory)
+                
+                pending.append(executor.submit(write, full_path, content.encode('utf-8')))
+                written.append(file_path)
             
-            # Escreve arquivo
-            full_path.write_text(content, encoding='utf-8')
+            for future in pending:
+                future.result()
+        
+        return base_path, written
     
     @staticmethod
     def _interactive_mode():
         """Modo interativo para geração de código"""
+        from code_generator import CodeGenerator, GeneratorConfig, PropertyConfig
+        
+        # Com stdin redirecionado (uso por scripts), lê uma linha por pergunta
+        # direto do arquivo, sem a preparação de terminal feita por input()
+        ask: Callable[[str], str]
+        if sys.stdin.isatty():
+            ask = input
+        else:
+            stdin = sys.stdin
+            stdout = sys.stdout
+            
+            def ask(prompt: str = '') -> str:
+                stdout.write(prompt)
+                stdout.flush()
+                line = stdin.readline()
+                if not line:
+                    raise EOFError('EOF when reading a line')
+                return line[:-1] if line.endswith('\n') else line
+        
         print("\n" + "="*60)
         print("🎯 Modo Interativo - Gerador de Código ArkTS")
         print("="*60 + "\n")
         
         try:
             # Nome da entidade
-            entity_name = input("📝 Nome da entidade (ex: User, Product): ").strip()
+            entity_name = ask("📝 Nome da entidade (ex: User, Product): ").strip()
             if not entity_name:
                 print("❌ Nome da entidade é obrigatório!")
                 return
             
-            # Capitaliza primeira letra
-            entity_name = entity_name[0].upper() + entity_name[1:]
+            # Capitaliza primeira letra (apenas se ainda não estiver capitalizada)
+            if entity_name[0].islower():
+                entity_name = entity_name[0].upper() + entity_name[1:]
             
             # Arquitetura
             print("\n📐 Escolha a arquitetura:")
             print("  1. Clean Architecture (recomendado)")
             print("  2. MVVM Tradicional")
-            arch_choice = input("Escolha (1-2) [1]: ").strip() or '1'
-            architecture = 'clean' if arch_choice == '1' else 'mvvm'
+            arch_choice = ask("Escolha (1-2) [1]: ").strip() or '1'
+            architecture: Literal['mvvm', 'clean'] = 'clean' if arch_choice == '1' else 'mvvm'
             
             # Propriedades
             print("\n📋 Defina as propriedades:")
             print("  Formato: nome:tipo")
-            print("  Tipos disponíveis: string, number, boolean, Date")
+            print(f"  Tipos disponíveis: {_VALID_TYPES_STR}")
             print("  Adicione '?' para opcional: nome:string?")
             print("  Digite 'fim' para finalizar\n")
             
             properties = [PropertyConfig(name='id', type='number', optional=False)]
+            names = {'id'}
             
             prop_count = 1
             while True:
-                prop_input = input(f"  Propriedade {prop_count} (ou 'fim'): ").strip()
+                prop_input = ask(f"  Propriedade {prop_count} (ou 'fim'): ").strip()
                 
                 if prop_input.lower() == 'fim':
                     break
@@ -211,24 +357,19 @@ Exemplos de uso:
                 if not prop_input:
                     continue
                 
-                if ':' not in prop_input:
-                    print("  ⚠️  Formato inválido! Use: nome:tipo")
+                spec = GeneratorCLI._parse_one_prop(prop_input)
+                if spec is None:
+                    if GeneratorCLI._invalid_prop_type(prop_input):
+                        print(f"  ⚠️  Tipo inválido! Use: {_VALID_TYPES_STR}")
+                    else:
+                        print("  ⚠️  Formato inválido! Use: nome:tipo")
                     continue
                 
-                name, type_str = prop_input.split(':', 1)
-                name = name.strip()
-                type_str = type_str.strip()
-                
-                optional = False
-                if type_str.endswith('?'):
-                    optional = True
-                    type_str = type_str[:-1].strip()
-                
-                valid_types = ['string', 'number', 'boolean', 'Date']
-                if type_str not in valid_types:
-                    print(f"  ⚠️  Tipo inválido! Use: {', '.join(valid_types)}")
+                name, type_str, optional = spec
+                if name in names:
+                    print(f"  ⚠️  Propriedade '{name}' já definida!")
                     continue
-                
+                names.add(name)
                 properties.append(PropertyConfig(
                     name=name,
                     type=type_str,
@@ -244,26 +385,25 @@ Exemplos de uso:
             
             # Opções
             print("\n⚙️  Opções adicionais:")
-            include_cache = input("  💾 Incluir cache local? (s/N): ").strip().lower() == 's'
-            include_validation = input("  ✅ Incluir validações? (s/N): ").strip().lower() == 's'
-            output_dir = input("  📁 Diretório de saída [./generated]: ").strip() or './generated'
+            include_cache = ask("  💾 Incluir cache local? (s/N): ").strip().lower() == 's'
+            include_validation = ask("  ✅ Incluir validações? (s/N): ").strip().lower() == 's'
+            output_dir = ask("  📁 Diretório de saída [./generated]: ").strip() or './generated'
             
             # Resumo
-            print("\n" + "="*60)
-            print("📊 Resumo da configuração:")
-            print("="*60)
-            print(f"  Entidade: {entity_name}")
-            print(f"  Arquitetura: {architecture.upper()}")
-            print(f"  Propriedades: {len(properties)}")
-            for prop in properties:
-                opt_marker = '?' if prop.optional else ''
-                print(f"    - {prop.name}: {prop.type}{opt_marker}")
-            print(f"  Cache: {'Sim' if include_cache else 'Não'}")
-            print(f"  Validação: {'Sim' if include_validation else 'Não'}")
-            print(f"  Output: {output_dir}")
-            print("="*60)
+            sys.stdout.write(_SUMMARY_TMPL.format_map({
+                'entity': entity_name,
+                'arch': architecture.upper(),
+                'count': len(properties),
+                'props': '\n'.join(
+                    f"    - {prop.name}: {prop.type}{'?' if prop.optional else ''}"
+                    for prop in properties
+                ),
+                'cache': _YN[include_cache],
+                'validation': _YN[include_validation],
+                'output': output_dir,
+            }))
             
-            confirm = input("\n✨ Gerar código? (S/n): ").strip().lower()
+            confirm = ask("\n✨ Gerar código? (S/n): ").strip().lower()
             if confirm == 'n':
                 print("❌ Operação cancelada.")
                 return
@@ -278,21 +418,21 @@ Exemplos de uso:
             )
             
             generator = CodeGenerator(config)
-            files = generator.generate_all()
-            
-            GeneratorCLI._write_files(files, output_dir)
+            out_abs, files = GeneratorCLI._write_files(generator.iter_files(), output_dir)
             
-            print(f"\n✅ {len(files)} arquivos ArkTS gerados com sucesso!")
-            print(f"📁 Localização: {Path(output_dir).absolute()}\n")
+            out = [
+                f"\n✅ {len(files)} arquivos ArkTS gerados com sucesso!",
+                f"📁 Localização: {out_abs}\n",
+                "📄 Alguns arquivos criados:",
+            ]
             
             # Lista alguns arquivos
-            print("📄 Alguns arquivos criados:")
-            for path in list(sorted(files.keys()))[:10]:
-                print(f"  ✓ {path}")
+            out.extend(f"  ✓ {path}" for path in heapq.nsmallest(10, files))
             if len(files) > 10:
-                print(f"  ... e mais {len(files) - 10} arquivos")
+                out.append(f"  ... e mais {len(files) - 10} arquivos")
             
-            print("\n🎉 Geração concluída!\n")
+            out.append("\n🎉 Geração concluída!\n")
+            sys.stdout.write('\n'.join(out) + '\n')
             
         except KeyboardInterrupt:
             print("\n\n❌ Operação cancelada pelo usuário.\n")
@@ -1,10 +1,23 @@
 # generator/code_generator.py
 
-from typing import List, Dict, Optional, Literal
+import string
+import sys
+from typing import Any, ClassVar, List, Dict, Iterator, Optional, Literal, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 
 
+# Tipos de propriedade e nome do identificador, internados para que as
+# comparações com os valores (também internados) de PropertyConfig se
+# resolvam por identidade
+_T_STRING = sys.intern('string')
+_T_NUMBER = sys.intern('number')
+_T_BOOL = sys.intern('boolean')
+_T_DATE = sys.intern('Date')
+_ID = sys.intern('id')
+
+
 class ValidationType(Enum):
     """Tipos de validação suportados"""
     REQUIRED = "required"
@@ -16,24 +29,50 @@ class ValidationType(Enum):
     PATTERN = "pattern"
 
 
-@dataclass
+# Atalhos de módulo para os tipos de validação, evitando a busca do membro
+# na classe a cada ValidationRule construída
+REQUIRED = ValidationType.REQUIRED
+MIN_LENGTH = ValidationType.MIN_LENGTH
+MAX_LENGTH = ValidationType.MAX_LENGTH
+EMAIL = ValidationType.EMAIL
+MIN = ValidationType.MIN
+MAX = ValidationType.MAX
+PATTERN = ValidationType.PATTERN
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationRule:
     """Regra de validação para propriedades"""
     type: ValidationType
-    value: Optional[any] = None
+    value: Optional[Any] = None
     message: Optional[str] = None
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Recriada pelo construtor: no build com mypyc, o __setstate__ gerado
+        # usa setattr, que a classe frozen recusa
+        return (type(self), (self.type, self.value, self.message))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PropertyConfig:
     """Configuração de propriedade da entidade"""
     name: str
     type: str  # Ex: "string", "number", "boolean", "Date"
     optional: bool = False
     validation: List[ValidationRule] = field(default_factory=list)
+    
+    def __post_init__(self) -> None:
+        # Nomes e tipos se repetem entre gerações; internados, comparações e
+        # hashes viram checagens de identidade
+        object.__setattr__(self, 'name', sys.intern(self.name))
+        object.__setattr__(self, 'type', sys.intern(self.type))
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Mesmo motivo de ValidationRule.__reduce__
+        return (type(self), (self.name, self.type, self.optional, self.validation))
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratorConfig:
     """Configuração principal do gerador"""
     entity_name: str
@@ -41,78 +80,401 @@ class GeneratorConfig:
     include_cache: bool = False
     include_validation: bool = False
     architecture: Literal['mvvm', 'clean'] = 'clean'
+    
+    def signature(self) -> Tuple[Any, ...]:
+        """Snapshot imutável da configuração, usado como chave de cache"""
+        # Valores das regras entram como texto, do jeito que os emissores os
+        # renderizam: 0, 0.0 e False são iguais para o Python, mas geram
+        # código diferente e não podem compartilhar a mesma entrada
+        return (
+            self.entity_name,
+            self.architecture,
+            self.include_cache,
+            self.include_validation,
+            tuple(
+                (p.name, p.type, p.optional, tuple((r.type, str(r.value), r.message) for r in p.validation))
+                for p in self.properties
+            ),
+        )
+
+
+# ==========================================
+# TEMPLATES
+# ==========================================
+# Os arquivos são montados por f-strings nos próprios métodos geradores;
+# aqui ficam apenas o template da página e trechos compartilhados. Chaves
+# literais do ArkTS aparecem escapadas como {{ e }}
+
+def _split_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Separa um template em pares (texto literal, campo), com as chaves já desescapadas"""
+    parts = []
+    for literal, name, format_spec, conversion in string.Formatter().parse(template):
+        # Os pares são montados por join, sem aplicar conversões nem formatos
+        if format_spec or conversion:
+            raise ValueError(f"Campo '{{{name}}}' com conversão ou formato não é suportado")
+        parts.append((literal, name))
+    return tuple(parts)
+
+
+_EMAIL_REGEX_DECL = "    const emailRegex = /^[^\\s@]+@[^\\s@]+\\.[^\\s@]+$/;\n"
+
+# Valor padrão no construtor por tipo (propriedades obrigatórias)
+_DEFAULT_BY_TYPE: Dict[str, str] = {
+    _T_STRING: " = ''",
+    _T_NUMBER: ' = 0',
+    _T_BOOL: ' = false',
+    _T_DATE: ' = new Date()',
+}
+
+# Campo do toJson por (é Date, é opcional)
+_TO_JSON_FMT: Dict[Tuple[bool, bool], str] = {
+    (True, True): "{n}: this.{n}?.toISOString()",
+    (True, False): "{n}: this.{n}.toISOString()",
+    (False, True): "{n}: this.{n}",
+    (False, False): "{n}: this.{n}",
+}
+
+_PAGE_TEMPLATE = '''// presentation/views/pages/{entity_name}Page.ets
+
+import {{ {entity_name}ViewModel }} from '../../viewmodels/{entity_name}ViewModel';
+import {{ {entity_name} }} from '../../../domain/entities/{entity_name}';
+import {{ AppContainer }} from '../../../di/AppContainer';
+import promptAction from '@ohos.promptAction';
+
+@Entry
+@Component
+struct {entity_name}Page {{
+  private container: AppContainer = AppContainer.getInstance();
+  @State private viewModel: {entity_name}ViewModel = this.container.create{entity_name}ViewModel();
+  
+  aboutToAppear() {{
+    this.viewModel.load{entity_plural}();
+  }}
+  
+  aboutToDisappear() {{
+    this.viewModel.onDestroy();
+  }}
+  
+  @Builder
+  {entity_name}ListItem(entity: {entity_name}) {{
+    Row() {{
+      Column({{ space: 4 }}) {{
+        Text(entity.{first_display})
+          .fontSize(16)
+          .fontWeight(FontWeight.Medium)
+          .fontColor($r('app.color.text_primary')){second_display_code}
+      }}
+      .alignItems(HorizontalAlign.Start)
+      .layoutWeight(1)
+      
+      Button('Deletar')
+        .fontSize(14)
+        .onClick(async () => {{
+          const success = await this.viewModel.delete{entity_name}(entity.id);
+          if (success) {{
+            promptAction.showToast({{ message: 'Deletado com sucesso', duration: 2000 }});
+          }}
+        }})
+    }}
+    .width('100%')
+    .padding(16)
+    .backgroundColor(Color.White)
+    .borderRadius(8)
+    .onClick(() => {{
+      this.viewModel.select{entity_name}(entity);
+    }})
+  }}
+  
+  @Builder
+  EmptyState() {{
+    Column({{ space: 16 }}) {{
+      Text('Nenhum registro encontrado')
+        .fontSize(16)
+        .fontColor($r('app.color.text_secondary'))
+      
+      Button('Recarregar')
+        .onClick(() => {{
+          this.viewModel.load{entity_plural}();
+        }})
+    }}
+    .width('100%')
+    .height('100%')
+    .justifyContent(FlexAlign.Center)
+  }}
+  
+  build() {{
+    Navigation() {{
+      Column() {{
+        if (this.viewModel.isLoading && this.viewModel.{entity_lower}s.length === 0) {{
+          LoadingProgress()
+            .width(60)
+            .height(60)
+        }} else if (this.viewModel.errorMessage) {{
+          Text(this.viewModel.errorMessage)
+            .fontSize(16)
+            .fontColor(Color.Red)
+            .padding(16)
+        }} else if (this.viewModel.{entity_lower}s.length === 0) {{
+          this.EmptyState();
+        }} else {{
+          List({{ space: 8 }}) {{
+            ForEach(
+              this.viewModel.{entity_lower}s,
+              (entity: {entity_name}) => {{
+                ListItem() {{
+                  this.{entity_name}ListItem(entity);
+                }}
+              }},
+              (entity: {entity_name}) => entity.id.toString()
+            )
+          }}
+          .width('100%')
+          .layoutWeight(1)
+          .padding(16)
+        }}
+      }}
+      .width('100%')
+      .height('100%')
+    }}
+    .title('{entity_name}s')
+    .titleMode(NavigationTitleMode.Mini)
+  }}
+}}'''
+
+
+# Maior template: pré-dividido uma vez para ser montado por join, sem que
+# str.format precise reanalisar o texto a cada geração
+_PAGE_TEMPLATE_PARTS = _split_template(_PAGE_TEMPLATE)
+
+# Segunda linha do item da lista (só quando há outra propriedade string)
+_PAGE_SECOND_DISPLAY_TEMPLATE = '''
+        Text(entity.{prop_name})
+          .fontSize(14)
+          .fontColor($r('app.color.text_secondary'))'''
+
+
+# ==========================================
+# VALIDATION EMITTERS
+# ==========================================
+# Cada função acrescenta em `parts` o trecho de validate() de uma regra
+
+def _emit_required(parts: List[str], prop: PropertyConfig, rule: ValidationRule) -> None:
+    pname = prop.name
+    if prop.type == _T_STRING:
+        parts.append(f"    if (!this.{pname} || this.{pname}.trim().length === 0) {{\n")
+    else:
+        parts.append(f"    if (this.{pname} === undefined || this.{pname} === null) {{\n")
+    parts.append(f"      throw new Error('{rule.message or f'{pname} é obrigatório'}');\n")
+    parts.append("    }\n")
+
+
+def _emit_min_length(parts: List[str], prop: PropertyConfig, rule: ValidationRule) -> None:
+    pname = prop.name
+    rvs = str(rule.value)
+    parts.append(f"    if (this.{pname}.length < {rvs}) {{\n")
+    parts.append(f"      throw new Error('{rule.message or f'{pname} deve ter no mínimo {rvs} caracteres'}');\n")
+    parts.append("    }\n")
+
+
+def _emit_max_length(parts: List[str], prop: PropertyConfig, rule: ValidationRule) -> None:
+    pname = prop.name
+    rvs = str(rule.value)
+    parts.append(f"    if (this.{pname}.length > {rvs}) {{\n")
+    parts.append(f"      throw new Error('{rule.message or f'{pname} deve ter no máximo {rvs} caracteres'}');\n")
+    parts.append("    }\n")
+
+
+def _emit_email(parts: List[str], prop: PropertyConfig, rule: ValidationRule) -> None:
+    parts.append(_EMAIL_REGEX_DECL)
+    parts.append(f"    if (!emailRegex.test(this.{prop.name})) {{\n")
+    parts.append(f"      throw new Error('{rule.message or f'{prop.name} inválido'}');\n")
+    parts.append("    }\n")
+
+
+def _emit_min(parts: List[str], prop: PropertyConfig, rule: ValidationRule) -> None:
+    pname = prop.name
+    rvs = str(rule.value)
+    parts.append(f"    if (this.{pname} < {rvs}) {{\n")
+    parts.append(f"      throw new Error('{rule.message or f'{pname} deve ser maior ou igual a {rvs}'}');\n")
+    parts.append("    }\n")
+
+
+def _emit_max(parts: List[str], prop: PropertyConfig, rule: ValidationRule) -> None:
+    pname = prop.name
+    rvs = str(rule.value)
+    parts.append(f"    if (this.{pname} > {rvs}) {{\n")
+    parts.append(f"      throw new Error('{rule.message or f'{pname} deve ser menor ou igual a {rvs}'}');\n")
+    parts.append("    }\n")
+
+
+def _emit_pattern(parts: List[str], prop: PropertyConfig, rule: ValidationRule) -> None:
+    parts.append(f"    const pattern = new RegExp('{rule.value}');\n")
+    parts.append(f"    if (!pattern.test(this.{prop.name})) {{\n")
+    parts.append(f"      throw new Error('{rule.message or f'{prop.name} inválido'}');\n")
+    parts.append("    }\n")
 
 
 class CodeGenerator:
     """Gerador de código ArkTS para arquiteturas Clean Architecture e MVVM"""
     
+    # Arquivos já gerados, por snapshot da configuração (mais recentes ao final)
+    _files_cache: ClassVar['OrderedDict[Tuple[Any, ...], Dict[str, str]]'] = OrderedDict()
+    _FILES_CACHE_SIZE = 32
+    
+    # Prefixo de indentação por nível
+    _INDENT_CACHE: ClassVar[Dict[int, str]] = {}
+    
+    # Emissor de código de validação por tipo de regra; novos tipos são
+    # suportados registrando aqui um _emit_*, sem mexer em _generate_validations
+    _VALIDATION_EMITTERS = {
+        ValidationType.REQUIRED: _emit_required,
+        ValidationType.MIN_LENGTH: _emit_min_length,
+        ValidationType.MAX_LENGTH: _emit_max_length,
+        ValidationType.EMAIL: _emit_email,
+        ValidationType.MIN: _emit_min,
+        ValidationType.MAX: _emit_max,
+        ValidationType.PATTERN: _emit_pattern,
+    }
+    
+    # Arquivos gerados: (caminho, método gerador, apenas com cache); definido
+    # por cada subclasse de arquitetura
+    _FILES: ClassVar[Tuple[Tuple[str, str, bool], ...]] = ()
+    
+    def __new__(cls, config: Optional[GeneratorConfig] = None) -> 'CodeGenerator':
+        # A arquitetura é resolvida uma única vez, na escolha da subclasse.
+        # config é opcional porque copy e pickle recriam a instância chamando
+        # __new__ da própria subclasse, sem argumentos. A subclasse é alocada
+        # pelo seu próprio __new__: no build com mypyc, object.__new__ recusa
+        # alocar uma classe nativa diferente de cls
+        if cls is CodeGenerator and config is not None:
+            target: 'type[CodeGenerator]' = CleanCodeGenerator if config.architecture == 'clean' else MvvmCodeGenerator
+            return target.__new__(target, config)
+        return super().__new__(cls)
+    
     def __init__(self, config: GeneratorConfig):
         self.config = config
-        self.entity_name_lower = config.entity_name.lower()
-        self.entity_name_plural = self._pluralize(self.entity_name_lower)
+        # Os nomes da entidade são interpolados em todos os templates
+        self.entity_name = sys.intern(config.entity_name)
+        self.entity_name_lower = sys.intern(self.entity_name.lower())
+        self.entity_name_plural = sys.intern(self._pluralize(self.entity_name_lower))
+        
+        # Recortes das propriedades consultados por vários geradores
+        self._props_no_id: List[PropertyConfig] = [p for p in config.properties if p.name != _ID]
+        self._string_props_no_id: List[PropertyConfig] = [p for p in self._props_no_id if p.type == _T_STRING]
+        self._first_string: Optional[PropertyConfig] = None
+        self._second_string: Optional[PropertyConfig] = None
+        if self._string_props_no_id:
+            first = self._first_string = self._string_props_no_id[0]
+            self._second_string = next(
+                (p for p in self._string_props_no_id[1:] if p.name != first.name), None
+            )
+        
+        # Trechos de create usados pelo use case e pelos ViewModels
+        self._create_params = self._get_create_params()
+        self._create_args = self._get_create_args()
+        self._entity_creation = self._get_entity_creation()
+        
+        # Substituições comuns a todos os templates
+        self._subs: Dict[str, str] = {
+            'entity_name': self.entity_name,
+            'entity_lower': self.entity_name_lower,
+            'entity_plural': self.entity_name_plural,
+        }
+        
+        # Configuração vista pelos trechos acima; a chave de cache vem daqui,
+        # não do config no momento da geração
+        self._signature = config.signature()
+        # A subclasse pode ser instanciada direto com um config de outra
+        # arquitetura, então ela também entra na chave
+        self._key: Tuple[Any, ...] = (type(self), self._signature)
     
     def generate_all(self) -> Dict[str, str]:
         """Gera todos os arquivos ArkTS baseado na arquitetura escolhida"""
-        files = {}
-        
-        if self.config.architecture == 'clean':
-            # Clean Architecture
-            files[f"domain/entities/{self.config.entity_name}.ets"] = self._generate_entity()
-            files[f"domain/repositories/I{self.config.entity_name}Repository.ets"] = self._generate_repository_interface()
-            files[f"domain/usecases/{self.entity_name_lower}/Get{self.entity_name_plural}UseCase.ets"] = self._generate_get_all_usecase()
-            files[f"domain/usecases/{self.entity_name_lower}/Get{self.config.entity_name}ByIdUseCase.ets"] = self._generate_get_by_id_usecase()
-            files[f"domain/usecases/{self.entity_name_lower}/Create{self.config.entity_name}UseCase.ets"] = self._generate_create_usecase()
-            files[f"domain/usecases/{self.entity_name_lower}/Update{self.config.entity_name}UseCase.ets"] = self._generate_update_usecase()
-            files[f"domain/usecases/{self.entity_name_lower}/Delete{self.config.entity_name}UseCase.ets"] = self._generate_delete_usecase()
-            
-            files[f"data/models/{self.config.entity_name}Model.ets"] = self._generate_model()
-            files[f"data/datasources/I{self.config.entity_name}RemoteDataSource.ets"] = self._generate_remote_datasource_interface()
-            files[f"data/datasources/{self.config.entity_name}RemoteDataSourceImpl.ets"] = self._generate_remote_datasource_impl()
-            
-            if self.config.include_cache:
-                files[f"data/datasources/I{self.config.entity_name}LocalDataSource.ets"] = self._generate_local_datasource_interface()
-                files[f"data/datasources/{self.config.entity_name}LocalDataSourceImpl.ets"] = self._generate_local_datasource_impl()
-            
-            files[f"data/repositories/{self.config.entity_name}RepositoryImpl.ets"] = self._generate_repository_impl()
-            files[f"presentation/viewmodels/{self.config.entity_name}ViewModel.ets"] = self._generate_viewmodel()
-            files[f"presentation/views/pages/{self.config.entity_name}Page.ets"] = self._generate_page()
-            
+        key = self._cache_key()
+        if self.config.signature() != self._signature:
+            # Config alterado depois da construção: a saída mistura o estado
+            # antigo e o novo e não pode ser compartilhada com outros geradores
+            return dict(self.iter_files())
+        cache = CodeGenerator._files_cache
+        files = cache.get(key)
+        if files is None:
+            files = {path: content for path, content in self.iter_files()}
+            cache[key] = files
+            if len(cache) > self._FILES_CACHE_SIZE:
+                cache.popitem(last=False)
         else:
-            # MVVM Tradicional
-            files[f"data/models/{self.config.entity_name}.ets"] = self._generate_simple_model()
-            files[f"data/repositories/{self.config.entity_name}Repository.ets"] = self._generate_simple_repository()
-            files[f"viewmodels/{self.config.entity_name}ViewModel.ets"] = self._generate_simple_viewmodel()
-            files[f"views/pages/{self.config.entity_name}Page.ets"] = self._generate_simple_page()
+            cache.move_to_end(key)
         
-        return files
+        # A cópia de um dict já é alocada no tamanho final, sem redimensionamentos
+        return files.copy()
+    
+    def _cache_key(self) -> Tuple[Any, ...]:
+        """Subclasse e snapshot imutável da configuração tirado na construção"""
+        return self._key
+    
+    def iter_files(self) -> Iterator[Tuple[str, str]]:
+        """Gera os arquivos ArkTS sob demanda, como pares (caminho, conteúdo)"""
+        subs = self._subs
+        include_cache = self.config.include_cache
+        
+        for path_template, method_name, cache_only in self._FILES:
+            if cache_only and not include_cache:
+                continue
+            yield path_template.format_map(subs), getattr(self, method_name)()
     
     def _pluralize(self, word: str) -> str:
         """Pluraliza uma palavra em inglês"""
-        if word.endswith('y'):
+        if not word:
+            return word
+        last = word[-1]
+        if last == 'y':
             return word[:-1] + 'ies'
-        if word.endswith(('s', 'x', 'z')):
+        if last in 'sxz':
             return word + 'es'
         return word + 's'
     
     # ==========================================
-    # CLEAN ARCHITECTURE GENERATORS
+    # SHARED GENERATORS
     # ==========================================
     
     def _generate_entity(self) -> str:
         """Gera a entidade de domínio em ArkTS"""
         properties = self._generate_properties()
         constructor_params = self._generate_constructor_params()
-        validations = self._generate_validations() if self.config.include_validation else ""
-        copy_method = self._generate_copy_method()
-        to_json_method = self._generate_to_json_method()
-        from_json_method = self._generate_from_json_method()
         
-        validation_call = "this.validate();" if self.config.include_validation else ""
-        validation_method = f"\n  {validations}\n  " if self.config.include_validation else ""
+        # Uma única passada pelas propriedades monta os trechos de copy/toJson/fromJson
+        update_params_parts = []
+        copy_args_parts = []
+        to_json_parts = []
+        from_json_parts = []
+        for p in self.config.properties:
+            update_params_parts.append(f"{p.name}?: {p.type}")
+            copy_args_parts.append(f"updates.{p.name} ?? this.{p.name}")
+            is_date = p.type == _T_DATE
+            to_json_parts.append(_TO_JSON_FMT[is_date, p.optional].format(n=p.name))
+            if is_date:
+                from_json_parts.append(f"new Date(json.{p.name} as string)")
+            else:
+                from_json_parts.append(f"json.{p.name} as {p.type}")
+        
+        copy_method = self._generate_copy_method(
+            ", ".join(update_params_parts),
+            ",\n      ".join(copy_args_parts)
+        )
+        to_json_method = self._generate_to_json_method(",\n      ".join(to_json_parts))
+        from_json_method = self._generate_from_json_method(",\n      ".join(from_json_parts))
+        
+        if self.config.include_validation:
+            validation_call = "this.validate();"
+            validation_method = f"\n  {self._generate_validations()}\n  "
+        else:
+            validation_call = ""
+            validation_method = ""
         
-        return f'''// domain/entities/{self.config.entity_name}.ets
+        name = self.entity_name
+        return f'''// domain/entities/{name}.ets
 
-export class {self.config.entity_name} {{
+export class {name} {{
 {properties}
   
   constructor(
@@ -130,108 +492,48 @@ export class {self.config.entity_name} {{
     
     def _generate_properties(self) -> str:
         """Gera as propriedades da classe"""
-        lines = []
-        for prop in self.config.properties:
-            optional = '?' if prop.optional else ''
-            readonly = 'readonly ' if prop.name == 'id' else ''
-            lines.append(f"  public {readonly}{prop.name}{optional}: {prop.type};")
-        return "\n".join(lines)
+        return "\n".join([
+            f"  public {'readonly ' if p.name == _ID else ''}{p.name}{'?' if p.optional else ''}: {p.type};"
+            for p in self.config.properties
+        ])
     
     def _generate_constructor_params(self) -> str:
         """Gera os parâmetros do construtor"""
-        params = []
-        for prop in self.config.properties:
-            optional = '?' if prop.optional else ''
-            default_value = self._get_default_value(prop)
-            params.append(f"    public {prop.name}{optional}: {prop.type}{default_value}")
-        return ",\n".join(params)
+        default_value = self._get_default_value
+        return ",\n".join([
+            f"    public {p.name}{'?' if p.optional else ''}: {p.type}{default_value(p)}"
+            for p in self.config.properties
+        ])
     
     def _generate_validations(self) -> str:
-        """Gera o método de validação"""
-        if not self.config.include_validation:
-            return ""
-        
-        validation_code = "private validate(): void {\n"
+        """Gera o método de validação (chamado apenas com include_validation)"""
+        parts = ["private validate(): void {\n"]
+        emitters = self._VALIDATION_EMITTERS
         
         for prop in self.config.properties:
-            if not prop.validation:
-                continue
-            
             for rule in prop.validation:
-                if rule.type == ValidationType.REQUIRED:
-                    if prop.type == 'string':
-                        validation_code += f"    if (!this.{prop.name} || this.{prop.name}.trim().length === 0) {{\n"
-                        validation_code += f"      throw new Error('{rule.message or prop.name + ' é obrigatório'}');\n"
-                        validation_code += "    }\n"
-                    else:
-                        validation_code += f"    if (this.{prop.name} === undefined || this.{prop.name} === null) {{\n"
-                        validation_code += f"      throw new Error('{rule.message or prop.name + ' é obrigatório'}');\n"
-                        validation_code += "    }\n"
-                
-                elif rule.type == ValidationType.MIN_LENGTH:
-                    validation_code += f"    if (this.{prop.name}.length < {rule.value}) {{\n"
-                    validation_code += f"      throw new Error('{rule.message or prop.name + ' deve ter no mínimo ' + str(rule.value) + ' caracteres'}');\n"
-                    validation_code += "    }\n"
-                
-                elif rule.type == ValidationType.MAX_LENGTH:
-                    validation_code += f"    if (this.{prop.name}.length > {rule.value}) {{\n"
-                    validation_code += f"      throw new Error('{rule.message or prop.name + ' deve ter no máximo ' + str(rule.value) + ' caracteres'}');\n"
-                    validation_code += "    }\n"
-                
-                elif rule.type == ValidationType.EMAIL:
-                    validation_code += f"    const emailRegex = /^[^\\s@]+@[^\\s@]+\\.[^\\s@]+$/;\n"
-                    validation_code += f"    if (!emailRegex.test(this.{prop.name})) {{\n"
-                    validation_code += f"      throw new Error('{rule.message or prop.name + ' inválido'}');\n"
-                    validation_code += "    }\n"
-                
-                elif rule.type == ValidationType.MIN:
-                    validation_code += f"    if (this.{prop.name} < {rule.value}) {{\n"
-                    validation_code += f"      throw new Error('{rule.message or prop.name + ' deve ser maior ou igual a ' + str(rule.value)}');\n"
-                    validation_code += "    }\n"
-                
-                elif rule.type == ValidationType.MAX:
-                    validation_code += f"    if (this.{prop.name} > {rule.value}) {{\n"
-                    validation_code += f"      throw new Error('{rule.message or prop.name + ' deve ser menor ou igual a ' + str(rule.value)}');\n"
-                    validation_code += "    }\n"
-                
-                elif rule.type == ValidationType.PATTERN:
-                    validation_code += f"    const pattern = new RegExp('{rule.value}');\n"
-                    validation_code += f"    if (!pattern.test(this.{prop.name})) {{\n"
-                    validation_code += f"      throw new Error('{rule.message or prop.name + ' inválido'}');\n"
-                    validation_code += "    }\n"
+                emitter = emitters.get(rule.type)
+                if emitter:
+                    emitter(parts, prop, rule)
         
-        validation_code += "  }"
-        return validation_code
+        parts.append("  }")
+        return "".join(parts)
     
-    def _generate_copy_method(self) -> str:
+    def _generate_copy_method(self, updates_params: str, copy_args: str) -> str:
         """Gera o método copy"""
-        updates_params = ", ".join([f"{p.name}?: {p.type}" for p in self.config.properties])
-        copy_args = ",\n      ".join([f"updates.{p.name} ?? this.{p.name}" for p in self.config.properties])
-        
+        name = self.entity_name
         return f'''/**
    * Cria uma cópia do objeto
    */
-  copy(updates?: {{ {updates_params} }}): {self.config.entity_name} {{
+  copy(updates?: {{ {updates_params} }}): {name} {{
     if (!updates) updates = {{}};
-    return new {self.config.entity_name}(
+    return new {name}(
       {copy_args}
     );
   }}'''
     
-    def _generate_to_json_method(self) -> str:
+    def _generate_to_json_method(self, json_body: str) -> str:
         """Gera o método toJson"""
-        json_fields = []
-        for prop in self.config.properties:
-            if prop.type == 'Date':
-                if prop.optional:
-                    json_fields.append(f"{prop.name}: this.{prop.name}?.toISOString()")
-                else:
-                    json_fields.append(f"{prop.name}: this.{prop.name}.toISOString()")
-            else:
-                json_fields.append(f"{prop.name}: this.{prop.name}")
-        
-        json_body = ",\n      ".join(json_fields)
-        
         return f'''/**
    * Converte para objeto simples
    */
@@ -241,206 +543,308 @@ export class {self.config.entity_name} {{
     }};
   }}'''
     
-    def _generate_from_json_method(self) -> str:
+    def _generate_from_json_method(self, from_json_body: str) -> str:
         """Gera o método fromJson estático"""
-        from_json_args = []
-        for prop in self.config.properties:
-            if prop.type == 'Date':
-                from_json_args.append(f"new Date(json.{prop.name} as string)")
-            else:
-                from_json_args.append(f"json.{prop.name} as {prop.type}")
-        
-        from_json_body = ",\n      ".join(from_json_args)
-        
+        name = self.entity_name
         return f'''/**
    * Cria instância a partir de JSON
    */
-  static fromJson(json: Record<string, Object>): {self.config.entity_name} {{
-    return new {self.config.entity_name}(
+  static fromJson(json: Record<string, Object>): {name} {{
+    return new {name}(
       {from_json_body}
     );
   }}'''
     
+    def _generate_page(self) -> str:
+        """Gera a página/view"""
+        first_display = self._first_string.name if self._first_string else 'name'
+        if self._second_string is None:
+            second_display_code = ''
+        else:
+            second_display_code = _PAGE_SECOND_DISPLAY_TEMPLATE.format(prop_name=self._second_string.name)
+        
+        values = dict(self._subs, first_display=first_display, second_display_code=second_display_code)
+        parts = []
+        for literal, name in _PAGE_TEMPLATE_PARTS:
+            parts.append(literal)
+            if name is not None:
+                parts.append(values[name])
+        return "".join(parts)
+    
+    # ==========================================
+    # HELPER METHODS
+    # ==========================================
+    
+    def _get_default_value(self, prop: PropertyConfig) -> str:
+        """Retorna valor padrão para propriedade"""
+        if prop.name == _ID:
+            return ' = 0'
+        if prop.optional:
+            return ''
+        return _DEFAULT_BY_TYPE.get(prop.type, '')
+    
+    def _generate_dto_properties(self) -> str:
+        """Gera propriedades do DTO"""
+        return "\n".join([
+            f"  {p.name}{'?' if p.optional else ''}: {_T_STRING if p.type == _T_DATE else p.type};"
+            for p in self.config.properties
+        ])
+    
+    def _build_mappings(self) -> Tuple[str, str]:
+        """Gera os mapeamentos DTO -> Domain e Domain -> DTO em uma única passada"""
+        to_domain = []
+        to_dto = []
+        for prop in self.config.properties:
+            if prop.type == _T_DATE:
+                to_domain.append(f"      new Date(dto.{prop.name})")
+                to_dto.append(f"      {prop.name}: entity.{prop.name}.toISOString()")
+            else:
+                to_domain.append(f"      dto.{prop.name}")
+                to_dto.append(f"      {prop.name}: entity.{prop.name}")
+        return ",\n".join(to_domain), ",\n".join(to_dto)
+    
+    def _get_create_params(self) -> str:
+        """Gera parâmetros para método create"""
+        return ", ".join(
+            f"{p.name}{'?' if p.optional else ''}: {p.type}"
+            for p in self._props_no_id
+        )
+    
+    def _get_create_args(self) -> str:
+        """Gera argumentos para método create"""
+        return ", ".join(p.name for p in self._props_no_id)
+    
+    def _get_entity_creation(self) -> str:
+        """Gera criação de entidade"""
+        return ", ".join("0" if p.name == _ID else p.name for p in self.config.properties)
+    
+    def _indent_code(self, text: str, level: int = 1) -> str:
+        """Indenta código"""
+        indent = self._INDENT_CACHE.get(level)
+        if indent is None:
+            indent = self._INDENT_CACHE[level] = "  " * level
+        # Linhas em branco não são indentadas
+        return '\n'.join([indent + line if line.strip() else line for line in text.split('\n')])
+
+
+class CleanCodeGenerator(CodeGenerator):
+    """Gerador para Clean Architecture"""
+    
+    _FILES: ClassVar[Tuple[Tuple[str, str, bool], ...]] = (
+        ("domain/entities/{entity_name}.ets", "_generate_entity", False),
+        ("domain/repositories/I{entity_name}Repository.ets", "_generate_repository_interface", False),
+        ("domain/usecases/{entity_lower}/Get{entity_plural}UseCase.ets", "_generate_get_all_usecase", False),
+        ("domain/usecases/{entity_lower}/Get{entity_name}ByIdUseCase.ets", "_generate_get_by_id_usecase", False),
+        ("domain/usecases/{entity_lower}/Create{entity_name}UseCase.ets", "_generate_create_usecase", False),
+        ("domain/usecases/{entity_lower}/Update{entity_name}UseCase.ets", "_generate_update_usecase", False),
+        ("domain/usecases/{entity_lower}/Delete{entity_name}UseCase.ets", "_generate_delete_usecase", False),
+        ("data/models/{entity_name}Model.ets", "_generate_model", False),
+        ("data/datasources/I{entity_name}RemoteDataSource.ets", "_generate_remote_datasource_interface", False),
+        ("data/datasources/{entity_name}RemoteDataSourceImpl.ets", "_generate_remote_datasource_impl", False),
+        ("data/datasources/I{entity_name}LocalDataSource.ets", "_generate_local_datasource_interface", True),
+        ("data/datasources/{entity_name}LocalDataSourceImpl.ets", "_generate_local_datasource_impl", True),
+        ("data/repositories/{entity_name}RepositoryImpl.ets", "_generate_repository_impl", False),
+        ("presentation/viewmodels/{entity_name}ViewModel.ets", "_generate_viewmodel", False),
+        ("presentation/views/pages/{entity_name}Page.ets", "_generate_page", False),
+    )
+    
     def _generate_repository_interface(self) -> str:
         """Gera a interface do repositório"""
-        return f'''// domain/repositories/I{self.config.entity_name}Repository.ets
+        name = self.entity_name
+        plural = self.entity_name_plural
+        return f'''// domain/repositories/I{name}Repository.ets
 
-import {{ {self.config.entity_name} }} from '../entities/{self.config.entity_name}';
+import {{ {name} }} from '../entities/{name}';
 
-export interface I{self.config.entity_name}Repository {{
-  get{self.entity_name_plural}(): Promise<{self.config.entity_name}[]>;
-  get{self.config.entity_name}ById(id: number): Promise<{self.config.entity_name}>;
-  create{self.config.entity_name}(entity: {self.config.entity_name}): Promise<{self.config.entity_name}>;
-  update{self.config.entity_name}(entity: {self.config.entity_name}): Promise<{self.config.entity_name}>;
-  delete{self.config.entity_name}(id: number): Promise<void>;
+export interface I{name}Repository {{
+  get{plural}(): Promise<{name}[]>;
+  get{name}ById(id: number): Promise<{name}>;
+  create{name}(entity: {name}): Promise<{name}>;
+  update{name}(entity: {name}): Promise<{name}>;
+  delete{name}(id: number): Promise<void>;
 }}'''
     
     def _generate_get_all_usecase(self) -> str:
         """Gera o use case GetAll"""
-        return f'''// domain/usecases/{self.entity_name_lower}/Get{self.entity_name_plural}UseCase.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        plural = self.entity_name_plural
+        return f'''// domain/usecases/{lower}/Get{plural}UseCase.ets
 
-import {{ {self.config.entity_name} }} from '../../entities/{self.config.entity_name}';
-import {{ I{self.config.entity_name}Repository }} from '../../repositories/I{self.config.entity_name}Repository';
+import {{ {name} }} from '../../entities/{name}';
+import {{ I{name}Repository }} from '../../repositories/I{name}Repository';
 
-export class Get{self.entity_name_plural}UseCase {{
-  constructor(private repository: I{self.config.entity_name}Repository) {{}}
+export class Get{plural}UseCase {{
+  constructor(private repository: I{name}Repository) {{}}
   
-  async execute(): Promise<{self.config.entity_name}[]> {{
-    return await this.repository.get{self.entity_name_plural}();
+  async execute(): Promise<{name}[]> {{
+    return await this.repository.get{plural}();
   }}
 }}'''
     
     def _generate_get_by_id_usecase(self) -> str:
         """Gera o use case GetById"""
-        return f'''// domain/usecases/{self.entity_name_lower}/Get{self.config.entity_name}ByIdUseCase.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        return f'''// domain/usecases/{lower}/Get{name}ByIdUseCase.ets
 
-import {{ {self.config.entity_name} }} from '../../entities/{self.config.entity_name}';
-import {{ I{self.config.entity_name}Repository }} from '../../repositories/I{self.config.entity_name}Repository';
+import {{ {name} }} from '../../entities/{name}';
+import {{ I{name}Repository }} from '../../repositories/I{name}Repository';
 
-export class Get{self.config.entity_name}ByIdUseCase {{
-  constructor(private repository: I{self.config.entity_name}Repository) {{}}
+export class Get{name}ByIdUseCase {{
+  constructor(private repository: I{name}Repository) {{}}
   
-  async execute(id: number): Promise<{self.config.entity_name}> {{
+  async execute(id: number): Promise<{name}> {{
     if (id <= 0) {{
       throw new Error('ID inválido');
     }}
-    return await this.repository.get{self.config.entity_name}ById(id);
+    return await this.repository.get{name}ById(id);
   }}
 }}'''
     
     def _generate_create_usecase(self) -> str:
         """Gera o use case Create"""
-        params = self._get_create_params()
-        entity_creation = self._get_entity_creation()
-        
-        return f'''// domain/usecases/{self.entity_name_lower}/Create{self.config.entity_name}UseCase.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        params = self._create_params
+        entity_creation = self._entity_creation
+        return f'''// domain/usecases/{lower}/Create{name}UseCase.ets
 
-import {{ {self.config.entity_name} }} from '../../entities/{self.config.entity_name}';
-import {{ I{self.config.entity_name}Repository }} from '../../repositories/I{self.config.entity_name}Repository';
+import {{ {name} }} from '../../entities/{name}';
+import {{ I{name}Repository }} from '../../repositories/I{name}Repository';
 
-export class Create{self.config.entity_name}UseCase {{
-  constructor(private repository: I{self.config.entity_name}Repository) {{}}
+export class Create{name}UseCase {{
+  constructor(private repository: I{name}Repository) {{}}
   
-  async execute({params}): Promise<{self.config.entity_name}> {{
-    const entity = new {self.config.entity_name}({entity_creation});
-    return await this.repository.create{self.config.entity_name}(entity);
+  async execute({params}): Promise<{name}> {{
+    const entity = new {name}({entity_creation});
+    return await this.repository.create{name}(entity);
   }}
 }}'''
     
     def _generate_update_usecase(self) -> str:
         """Gera o use case Update"""
-        return f'''// domain/usecases/{self.entity_name_lower}/Update{self.config.entity_name}UseCase.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        return f'''// domain/usecases/{lower}/Update{name}UseCase.ets
 
-import {{ {self.config.entity_name} }} from '../../entities/{self.config.entity_name}';
-import {{ I{self.config.entity_name}Repository }} from '../../repositories/I{self.config.entity_name}Repository';
+import {{ {name} }} from '../../entities/{name}';
+import {{ I{name}Repository }} from '../../repositories/I{name}Repository';
 
-export class Update{self.config.entity_name}UseCase {{
-  constructor(private repository: I{self.config.entity_name}Repository) {{}}
+export class Update{name}UseCase {{
+  constructor(private repository: I{name}Repository) {{}}
   
-  async execute(id: number, updates: Partial<{self.config.entity_name}>): Promise<{self.config.entity_name}> {{
-    const existing = await this.repository.get{self.config.entity_name}ById(id);
+  async execute(id: number, updates: Partial<{name}>): Promise<{name}> {{
+    const existing = await this.repository.get{name}ById(id);
     const updated = existing.copy(updates);
-    return await this.repository.update{self.config.entity_name}(updated);
+    return await this.repository.update{name}(updated);
   }}
 }}'''
     
     def _generate_delete_usecase(self) -> str:
         """Gera o use case Delete"""
-        return f'''// domain/usecases/{self.entity_name_lower}/Delete{self.config.entity_name}UseCase.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        return f'''// domain/usecases/{lower}/Delete{name}UseCase.ets
 
-import {{ I{self.config.entity_name}Repository }} from '../../repositories/I{self.config.entity_name}Repository';
+import {{ I{name}Repository }} from '../../repositories/I{name}Repository';
 
-export class Delete{self.config.entity_name}UseCase {{
-  constructor(private repository: I{self.config.entity_name}Repository) {{}}
+export class Delete{name}UseCase {{
+  constructor(private repository: I{name}Repository) {{}}
   
   async execute(id: number): Promise<void> {{
     if (id <= 0) {{
       throw new Error('ID inválido');
     }}
-    await this.repository.delete{self.config.entity_name}(id);
+    await this.repository.delete{name}(id);
   }}
 }}'''
     
     def _generate_model(self) -> str:
         """Gera o modelo DTO e Mapper"""
         dto_properties = self._generate_dto_properties()
-        to_domain_mapping = self._generate_to_domain_mapping()
-        to_dto_mapping = self._generate_to_dto_mapping()
+        to_domain_mapping, to_dto_mapping = self._build_mappings()
+        name = self.entity_name
         
-        return f'''// data/models/{self.config.entity_name}Model.ets
+        return f'''// data/models/{name}Model.ets
 
-import {{ {self.config.entity_name} }} from '../../domain/entities/{self.config.entity_name}';
+import {{ {name} }} from '../../domain/entities/{name}';
 
-export interface {self.config.entity_name}DTO {{
+export interface {name}DTO {{
 {dto_properties}
 }}
 
-export class {self.config.entity_name}Mapper {{
-  static toDomain(dto: {self.config.entity_name}DTO): {self.config.entity_name} {{
-    return new {self.config.entity_name}(
+export class {name}Mapper {{
+  static toDomain(dto: {name}DTO): {name} {{
+    return new {name}(
 {to_domain_mapping}
     );
   }}
   
-  static toDTO(entity: {self.config.entity_name}): {self.config.entity_name}DTO {{
+  static toDTO(entity: {name}): {name}DTO {{
     return {{
 {to_dto_mapping}
     }};
   }}
   
-  static toDomainList(dtos: {self.config.entity_name}DTO[]): {self.config.entity_name}[] {{
+  static toDomainList(dtos: {name}DTO[]): {name}[] {{
     return dtos.map(dto => this.toDomain(dto));
   }}
   
-  static toDTOList(entities: {self.config.entity_name}[]): {self.config.entity_name}DTO[] {{
+  static toDTOList(entities: {name}[]): {name}DTO[] {{
     return entities.map(entity => this.toDTO(entity));
   }}
 }}'''
     
     def _generate_remote_datasource_interface(self) -> str:
         """Gera a interface do datasource remoto"""
-        return f'''// data/datasources/I{self.config.entity_name}RemoteDataSource.ets
+        name = self.entity_name
+        plural = self.entity_name_plural
+        return f'''// data/datasources/I{name}RemoteDataSource.ets
 
-import {{ {self.config.entity_name}DTO }} from '../models/{self.config.entity_name}Model';
+import {{ {name}DTO }} from '../models/{name}Model';
 
-export interface I{self.config.entity_name}RemoteDataSource {{
-  fetch{self.entity_name_plural}(): Promise<{self.config.entity_name}DTO[]>;
-  fetch{self.config.entity_name}ById(id: number): Promise<{self.config.entity_name}DTO>;
-  create{self.config.entity_name}(dto: {self.config.entity_name}DTO): Promise<{self.config.entity_name}DTO>;
-  update{self.config.entity_name}(dto: {self.config.entity_name}DTO): Promise<{self.config.entity_name}DTO>;
-  delete{self.config.entity_name}(id: number): Promise<void>;
+export interface I{name}RemoteDataSource {{
+  fetch{plural}(): Promise<{name}DTO[]>;
+  fetch{name}ById(id: number): Promise<{name}DTO>;
+  create{name}(dto: {name}DTO): Promise<{name}DTO>;
+  update{name}(dto: {name}DTO): Promise<{name}DTO>;
+  delete{name}(id: number): Promise<void>;
 }}'''
     
     def _generate_remote_datasource_impl(self) -> str:
         """Gera a implementação do datasource remoto"""
-        return f'''// data/datasources/{self.config.entity_name}RemoteDataSourceImpl.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        plural = self.entity_name_plural
+        return f'''// data/datasources/{name}RemoteDataSourceImpl.ets
 
 import http from '@ohos.net.http';
-import {{ {self.config.entity_name}DTO }} from '../models/{self.config.entity_name}Model';
-import {{ I{self.config.entity_name}RemoteDataSource }} from './I{self.config.entity_name}RemoteDataSource';
+import {{ {name}DTO }} from '../models/{name}Model';
+import {{ I{name}RemoteDataSource }} from './I{name}RemoteDataSource';
 
-export class {self.config.entity_name}RemoteDataSourceImpl implements I{self.config.entity_name}RemoteDataSource {{
+export class {name}RemoteDataSourceImpl implements I{name}RemoteDataSource {{
   private baseUrl: string = 'https://api.example.com';
-  private endpoint: string = '/{self.entity_name_lower}s';
+  private endpoint: string = '/{lower}s';
   
-  async fetch{self.entity_name_plural}(): Promise<{self.config.entity_name}DTO[]> {{
-    const response = await this.makeRequest<{{ data: {self.config.entity_name}DTO[] }}>(
+  async fetch{plural}(): Promise<{name}DTO[]> {{
+    const response = await this.makeRequest<{{ data: {name}DTO[] }}>(
       this.endpoint,
       'GET'
     );
     return response.data;
   }}
   
-  async fetch{self.config.entity_name}ById(id: number): Promise<{self.config.entity_name}DTO> {{
-    const response = await this.makeRequest<{{ data: {self.config.entity_name}DTO }}>(
+  async fetch{name}ById(id: number): Promise<{name}DTO> {{
+    const response = await this.makeRequest<{{ data: {name}DTO }}>(
       `${{this.endpoint}}/${{id}}`,
       'GET'
     );
     return response.data;
   }}
   
-  async create{self.config.entity_name}(dto: {self.config.entity_name}DTO): Promise<{self.config.entity_name}DTO> {{
-    const response = await this.makeRequest<{{ data: {self.config.entity_name}DTO }}>(
+  async create{name}(dto: {name}DTO): Promise<{name}DTO> {{
+    const response = await this.makeRequest<{{ data: {name}DTO }}>(
       this.endpoint,
       'POST',
       dto
@@ -448,8 +852,8 @@ export class {self.config.entity_name}RemoteDataSourceImpl implements I{self.con
     return response.data;
   }}
   
-  async update{self.config.entity_name}(dto: {self.config.entity_name}DTO): Promise<{self.config.entity_name}DTO> {{
-    const response = await this.makeRequest<{{ data: {self.config.entity_name}DTO }}>(
+  async update{name}(dto: {name}DTO): Promise<{name}DTO> {{
+    const response = await this.makeRequest<{{ data: {name}DTO }}>(
       `${{this.endpoint}}/${{dto.id}}`,
       'PUT',
       dto
@@ -457,7 +861,7 @@ export class {self.config.entity_name}RemoteDataSourceImpl implements I{self.con
     return response.data;
   }}
   
-  async delete{self.config.entity_name}(id: number): Promise<void> {{
+  async delete{name}(id: number): Promise<void> {{
     await this.makeRequest<void>(`${{this.endpoint}}/${{id}}`, 'DELETE');
   }}
   
@@ -489,42 +893,47 @@ export class {self.config.entity_name}RemoteDataSourceImpl implements I{self.con
     
     def _generate_local_datasource_interface(self) -> str:
         """Gera a interface do datasource local"""
-        return f'''// data/datasources/I{self.config.entity_name}LocalDataSource.ets
+        name = self.entity_name
+        plural = self.entity_name_plural
+        return f'''// data/datasources/I{name}LocalDataSource.ets
 
-import {{ {self.config.entity_name}DTO }} from '../models/{self.config.entity_name}Model';
+import {{ {name}DTO }} from '../models/{name}Model';
 
-export interface I{self.config.entity_name}LocalDataSource {{
-  getCached{self.entity_name_plural}(): Promise<{self.config.entity_name}DTO[]>;
-  cache{self.entity_name_plural}(dtos: {self.config.entity_name}DTO[]): Promise<void>;
+export interface I{name}LocalDataSource {{
+  getCached{plural}(): Promise<{name}DTO[]>;
+  cache{plural}(dtos: {name}DTO[]): Promise<void>;
   clearCache(): Promise<void>;
 }}'''
     
     def _generate_local_datasource_impl(self) -> str:
         """Gera a implementação do datasource local"""
-        return f'''// data/datasources/{self.config.entity_name}LocalDataSourceImpl.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        plural = self.entity_name_plural
+        return f'''// data/datasources/{name}LocalDataSourceImpl.ets
 
 import preferences from '@ohos.data.preferences';
-import {{ {self.config.entity_name}DTO }} from '../models/{self.config.entity_name}Model';
-import {{ I{self.config.entity_name}LocalDataSource }} from './I{self.config.entity_name}LocalDataSource';
+import {{ {name}DTO }} from '../models/{name}Model';
+import {{ I{name}LocalDataSource }} from './I{name}LocalDataSource';
 
-export class {self.config.entity_name}LocalDataSourceImpl implements I{self.config.entity_name}LocalDataSource {{
-  private readonly CACHE_KEY = '{self.entity_name_lower}_cache';
+export class {name}LocalDataSourceImpl implements I{name}LocalDataSource {{
+  private readonly CACHE_KEY = '{lower}_cache';
   private preferencesStore?: preferences.Preferences;
   
   async initialize(context: Context): Promise<void> {{
     this.preferencesStore = await preferences.getPreferences(context, 'app_cache');
   }}
   
-  async getCached{self.entity_name_plural}(): Promise<{self.config.entity_name}DTO[]> {{
+  async getCached{plural}(): Promise<{name}DTO[]> {{
     if (!this.preferencesStore) {{
       throw new Error('DataSource not initialized');
     }}
     
     const cached = await this.preferencesStore.get(this.CACHE_KEY, '[]');
-    return JSON.parse(cached as string) as {self.config.entity_name}DTO[];
+    return JSON.parse(cached as string) as {name}DTO[];
   }}
   
-  async cache{self.entity_name_plural}(dtos: {self.config.entity_name}DTO[]): Promise<void> {{
+  async cache{plural}(dtos: {name}DTO[]): Promise<void> {{
     if (!this.preferencesStore) {{
       throw new Error('DataSource not initialized');
     }}
@@ -545,130 +954,137 @@ export class {self.config.entity_name}LocalDataSourceImpl implements I{self.conf
     
     def _generate_repository_impl(self) -> str:
         """Gera a implementação do repositório"""
+        name = self.entity_name
+        plural = self.entity_name_plural
         cache_import = ""
         cache_constructor_param = ""
         cache_constructor_assign = ""
         cache_logic = ""
         
         if self.config.include_cache:
-            cache_import = f"import {{ I{self.config.entity_name}LocalDataSource }} from '../datasources/I{self.config.entity_name}LocalDataSource';"
-            cache_constructor_param = f",\n    private localDataSource: I{self.config.entity_name}LocalDataSource"
+            cache_import = f"import {{ I{name}LocalDataSource }} from '../datasources/I{name}LocalDataSource';"
+            cache_constructor_param = f",\n    private localDataSource: I{name}LocalDataSource"
             cache_logic = f'''try {{
-      const dtos = await this.remoteDataSource.fetch{self.entity_name_plural}();
-      await this.localDataSource.cache{self.entity_name_plural}(dtos);
-      return {self.config.entity_name}Mapper.toDomainList(dtos);
+      const dtos = await this.remoteDataSource.fetch{plural}();
+      await this.localDataSource.cache{plural}(dtos);
+      return {name}Mapper.toDomainList(dtos);
     }} catch (error) {{
-      const cachedDtos = await this.localDataSource.getCached{self.entity_name_plural}();
-      return {self.config.entity_name}Mapper.toDomainList(cachedDtos);
+      const cachedDtos = await this.localDataSource.getCached{plural}();
+      return {name}Mapper.toDomainList(cachedDtos);
     }}'''
         else:
-            cache_logic = f'''const dtos = await this.remoteDataSource.fetch{self.entity_name_plural}();
-    return {self.config.entity_name}Mapper.toDomainList(dtos);'''
+            cache_logic = f'''const dtos = await this.remoteDataSource.fetch{plural}();
+    return {name}Mapper.toDomainList(dtos);'''
         
-        return f'''// data/repositories/{self.config.entity_name}RepositoryImpl.ets
+        return f'''// data/repositories/{name}RepositoryImpl.ets
 
-import {{ {self.config.entity_name} }} from '../../domain/entities/{self.config.entity_name}';
-import {{ I{self.config.entity_name}Repository }} from '../../domain/repositories/I{self.config.entity_name}Repository';
-import {{ {self.config.entity_name}Mapper }} from '../models/{self.config.entity_name}Model';
-import {{ I{self.config.entity_name}RemoteDataSource }} from '../datasources/I{self.config.entity_name}RemoteDataSource';
+import {{ {name} }} from '../../domain/entities/{name}';
+import {{ I{name}Repository }} from '../../domain/repositories/I{name}Repository';
+import {{ {name}Mapper }} from '../models/{name}Model';
+import {{ I{name}RemoteDataSource }} from '../datasources/I{name}RemoteDataSource';
 {cache_import}
 
-export class {self.config.entity_name}RepositoryImpl implements I{self.config.entity_name}Repository {{
+export class {name}RepositoryImpl implements I{name}Repository {{
   constructor(
-    private remoteDataSource: I{self.config.entity_name}RemoteDataSource{cache_constructor_param}
+    private remoteDataSource: I{name}RemoteDataSource{cache_constructor_param}
   ) {{}}
   
-  async get{self.entity_name_plural}(): Promise<{self.config.entity_name}[]> {{
+  async get{plural}(): Promise<{name}[]> {{
     {cache_logic}
   }}
   
-  async get{self.config.entity_name}ById(id: number): Promise<{self.config.entity_name}> {{
-    const dto = await this.remoteDataSource.fetch{self.config.entity_name}ById(id);
-    return {self.config.entity_name}Mapper.toDomain(dto);
+  async get{name}ById(id: number): Promise<{name}> {{
+    const dto = await this.remoteDataSource.fetch{name}ById(id);
+    return {name}Mapper.toDomain(dto);
   }}
   
-  async create{self.config.entity_name}(entity: {self.config.entity_name}): Promise<{self.config.entity_name}> {{
-    const dto = {self.config.entity_name}Mapper.toDTO(entity);
-    const createdDto = await this.remoteDataSource.create{self.config.entity_name}(dto);
-    return {self.config.entity_name}Mapper.toDomain(createdDto);
+  async create{name}(entity: {name}): Promise<{name}> {{
+    const dto = {name}Mapper.toDTO(entity);
+    const createdDto = await this.remoteDataSource.create{name}(dto);
+    return {name}Mapper.toDomain(createdDto);
   }}
   
-  async update{self.config.entity_name}(entity: {self.config.entity_name}): Promise<{self.config.entity_name}> {{
-    const dto = {self.config.entity_name}Mapper.toDTO(entity);
-    const updatedDto = await this.remoteDataSource.update{self.config.entity_name}(dto);
-    return {self.config.entity_name}Mapper.toDomain(updatedDto);
+  async update{name}(entity: {name}): Promise<{name}> {{
+    const dto = {name}Mapper.toDTO(entity);
+    const updatedDto = await this.remoteDataSource.update{name}(dto);
+    return {name}Mapper.toDomain(updatedDto);
   }}
   
-  async delete{self.config.entity_name}(id: number): Promise<void> {{
-    await this.remoteDataSource.delete{self.config.entity_name}(id);
+  async delete{name}(id: number): Promise<void> {{
+    await this.remoteDataSource.delete{name}(id);
   }}
 }}'''
     
     def _generate_viewmodel(self) -> str:
         """Gera o ViewModel"""
-        return f'''// presentation/viewmodels/{self.config.entity_name}ViewModel.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        plural = self.entity_name_plural
+        create_params = self._create_params
+        create_args = self._create_args
+        return f'''// presentation/viewmodels/{name}ViewModel.ets
 
 import {{ BaseViewModel }} from './base/BaseViewModel';
-import {{ {self.config.entity_name} }} from '../../domain/entities/{self.config.entity_name}';
-import {{ Get{self.entity_name_plural}UseCase }} from '../../domain/usecases/{self.entity_name_lower}/Get{self.entity_name_plural}UseCase';
-import {{ Get{self.config.entity_name}ByIdUseCase }} from '../../domain/usecases/{self.entity_name_lower}/Get{self.config.entity_name}ByIdUseCase';
-import {{ Create{self.config.entity_name}UseCase }} from '../../domain/usecases/{self.entity_name_lower}/Create{self.config.entity_name}UseCase';
-import {{ Update{self.config.entity_name}UseCase }} from '../../domain/usecases/{self.entity_name_lower}/Update{self.config.entity_name}UseCase';
-import {{ Delete{self.config.entity_name}UseCase }} from '../../domain/usecases/{self.entity_name_lower}/Delete{self.config.entity_name}UseCase';
+import {{ {name} }} from '../../domain/entities/{name}';
+import {{ Get{plural}UseCase }} from '../../domain/usecases/{lower}/Get{plural}UseCase';
+import {{ Get{name}ByIdUseCase }} from '../../domain/usecases/{lower}/Get{name}ByIdUseCase';
+import {{ Create{name}UseCase }} from '../../domain/usecases/{lower}/Create{name}UseCase';
+import {{ Update{name}UseCase }} from '../../domain/usecases/{lower}/Update{name}UseCase';
+import {{ Delete{name}UseCase }} from '../../domain/usecases/{lower}/Delete{name}UseCase';
 
 @Observed
-export class {self.config.entity_name}ViewModel extends BaseViewModel {{
-  @State {self.entity_name_lower}s: {self.config.entity_name}[] = [];
-  @State selected{self.config.entity_name}: {self.config.entity_name} | null = null;
+export class {name}ViewModel extends BaseViewModel {{
+  @State {lower}s: {name}[] = [];
+  @State selected{name}: {name} | null = null;
   
   constructor(
-    private get{self.entity_name_plural}UseCase: Get{self.entity_name_plural}UseCase,
-    private get{self.config.entity_name}ByIdUseCase: Get{self.config.entity_name}ByIdUseCase,
-    private create{self.config.entity_name}UseCase: Create{self.config.entity_name}UseCase,
-    private update{self.config.entity_name}UseCase: Update{self.config.entity_name}UseCase,
-    private delete{self.config.entity_name}UseCase: Delete{self.config.entity_name}UseCase
+    private get{plural}UseCase: Get{plural}UseCase,
+    private get{name}ByIdUseCase: Get{name}ByIdUseCase,
+    private create{name}UseCase: Create{name}UseCase,
+    private update{name}UseCase: Update{name}UseCase,
+    private delete{name}UseCase: Delete{name}UseCase
   ) {{
     super();
   }}
   
-  async load{self.entity_name_plural}(): Promise<void> {{
+  async load{plural}(): Promise<void> {{
     await this.executeUseCase(
-      () => this.get{self.entity_name_plural}UseCase.execute(),
+      () => this.get{plural}UseCase.execute(),
       (result) => {{
-        this.{self.entity_name_lower}s = result;
+        this.{lower}s = result;
       }}
     );
   }}
   
-  async load{self.config.entity_name}ById(id: number): Promise<void> {{
+  async load{name}ById(id: number): Promise<void> {{
     await this.executeUseCase(
-      () => this.get{self.config.entity_name}ByIdUseCase.execute(id),
+      () => this.get{name}ByIdUseCase.execute(id),
       (result) => {{
-        this.selected{self.config.entity_name} = result;
+        this.selected{name} = result;
       }}
     );
   }}
   
-  async create{self.config.entity_name}({self._get_create_params()}): Promise<boolean> {{
+  async create{name}({create_params}): Promise<boolean> {{
     let success = false;
     await this.executeUseCase(
-      () => this.create{self.config.entity_name}UseCase.execute({self._get_create_args()}),
+      () => this.create{name}UseCase.execute({create_args}),
       (result) => {{
-        this.{self.entity_name_lower}s.push(result);
+        this.{lower}s.push(result);
         success = true;
       }}
     );
     return success;
   }}
   
-  async update{self.config.entity_name}(id: number, updates: Partial<{self.config.entity_name}>): Promise<boolean> {{
+  async update{name}(id: number, updates: Partial<{name}>): Promise<boolean> {{
     let success = false;
     await this.executeUseCase(
-      () => this.update{self.config.entity_name}UseCase.execute(id, updates),
+      () => this.update{name}UseCase.execute(id, updates),
       (result) => {{
-        const index = this.{self.entity_name_lower}s.findIndex(e => e.id === id);
+        const index = this.{lower}s.findIndex(e => e.id === id);
         if (index !== -1) {{
-          this.{self.entity_name_lower}s[index] = result;
+          this.{lower}s[index] = result;
         }}
         success = true;
       }}
@@ -676,244 +1092,138 @@ export class {self.config.entity_name}ViewModel extends BaseViewModel {{
     return success;
   }}
   
-  async delete{self.config.entity_name}(id: number): Promise<boolean> {{
+  async delete{name}(id: number): Promise<boolean> {{
     let success = false;
     await this.executeUseCase(
-      () => this.delete{self.config.entity_name}UseCase.execute(id),
+      () => this.delete{name}UseCase.execute(id),
       () => {{
-        this.{self.entity_name_lower}s = this.{self.entity_name_lower}s.filter(e => e.id !== id);
+        this.{lower}s = this.{lower}s.filter(e => e.id !== id);
         success = true;
       }}
     );
     return success;
   }}
   
-  select{self.config.entity_name}(entity: {self.config.entity_name}): void {{
-    this.selected{self.config.entity_name} = entity;
+  select{name}(entity: {name}): void {{
+    this.selected{name} = entity;
   }}
   
   clearSelected(): void {{
-    this.selected{self.config.entity_name} = null;
+    this.selected{name} = null;
   }}
   
   onDestroy(): void {{
-    this.{self.entity_name_lower}s = [];
-    this.selected{self.config.entity_name} = null;
+    this.{lower}s = [];
+    this.selected{name} = null;
   }}
 }}'''
-    
-    def _generate_page(self) -> str:
-        """Gera a página/view"""
-        first_prop = next((p for p in self.config.properties if p.type == 'string' and p.name != 'id'), None)
-        second_prop = next((p for p in self.config.properties if p.type == 'string' and p.name != 'id' and p.name != (first_prop.name if first_prop else '')), None)
-        
-        first_display = first_prop.name if first_prop else 'name'
-        second_display_code = f'''
-        Text(entity.{second_prop.name})
-          .fontSize(14)
-          .fontColor($r('app.color.text_secondary'))''' if second_prop else ''
-        
-        return f'''// presentation/views/pages/{self.config.entity_name}Page.ets
 
-import {{ {self.config.entity_name}ViewModel }} from '../../viewmodels/{self.config.entity_name}ViewModel';
-import {{ {self.config.entity_name} }} from '../../../domain/entities/{self.config.entity_name}';
-import {{ AppContainer }} from '../../../di/AppContainer';
-import promptAction from '@ohos.promptAction';
 
-@Entry
-@Component
-struct {self.config.entity_name}Page {{
-  private container: AppContainer = AppContainer.getInstance();
-  @State private viewModel: {self.config.entity_name}ViewModel = this.container.create{self.config.entity_name}ViewModel();
-  
-  aboutToAppear() {{
-    this.viewModel.load{self.entity_name_plural}();
-  }}
-  
-  aboutToDisappear() {{
-    this.viewModel.onDestroy();
-  }}
-  
-  @Builder
-  {self.config.entity_name}ListItem(entity: {self.config.entity_name}) {{
-    Row() {{
-      Column({{ space: 4 }}) {{
-        Text(entity.{first_display})
-          .fontSize(16)
-          .fontWeight(FontWeight.Medium)
-          .fontColor($r('app.color.text_primary')){second_display_code}
-      }}
-      .alignItems(HorizontalAlign.Start)
-      .layoutWeight(1)
-      
-      Button('Deletar')
-        .fontSize(14)
-        .onClick(async () => {{
-          const success = await this.viewModel.delete{self.config.entity_name}(entity.id);
-          if (success) {{
-            promptAction.showToast({{ message: 'Deletado com sucesso', duration: 2000 }});
-          }}
-        }})
-    }}
-    .width('100%')
-    .padding(16)
-    .backgroundColor(Color.White)
-    .borderRadius(8)
-    .onClick(() => {{
-      this.viewModel.select{self.config.entity_name}(entity);
-    }})
-  }}
-  
-  @Builder
-  EmptyState() {{
-    Column({{ space: 16 }}) {{
-      Text('Nenhum registro encontrado')
-        .fontSize(16)
-        .fontColor($r('app.color.text_secondary'))
-      
-      Button('Recarregar')
-        .onClick(() => {{
-          this.viewModel.load{self.entity_name_plural}();
-        }})
-    }}
-    .width('100%')
-    .height('100%')
-    .justifyContent(FlexAlign.Center)
-  }}
-  
-  build() {{
-    Navigation() {{
-      Column() {{
-        if (this.viewModel.isLoading && this.viewModel.{self.entity_name_lower}s.length === 0) {{
-          LoadingProgress()
-            .width(60)
-            .height(60)
-        }} else if (this.viewModel.errorMessage) {{
-          Text(this.viewModel.errorMessage)
-            .fontSize(16)
-            .fontColor(Color.Red)
-            .padding(16)
-        }} else if (this.viewModel.{self.entity_name_lower}s.length === 0) {{
-          this.EmptyState();
-        }} else {{
-          List({{ space: 8 }}) {{
-            ForEach(
-              this.viewModel.{self.entity_name_lower}s,
-              (entity: {self.config.entity_name}) => {{
-                ListItem() {{
-                  this.{self.config.entity_name}ListItem(entity);
-                }}
-              }},
-              (entity: {self.config.entity_name}) => entity.id.toString()
-            )
-          }}
-          .width('100%')
-          .layoutWeight(1)
-          .padding(16)
-        }}
-      }}
-      .width('100%')
-      .height('100%')
-    }}
-    .title('{self.config.entity_name}s')
-    .titleMode(NavigationTitleMode.Mini)
-  }}
-}}'''
-    
-    # ==========================================
-    # MVVM TRADICIONAL GENERATORS
-    # ==========================================
+class MvvmCodeGenerator(CodeGenerator):
+    """Gerador para MVVM tradicional"""
     
-    def _generate_simple_model(self) -> str:
-        """Gera modelo simples para MVVM"""
-        return self._generate_entity()
+    # Modelo e página do MVVM são os mesmos da entidade e da página comuns
+    _FILES: ClassVar[Tuple[Tuple[str, str, bool], ...]] = (
+        ("data/models/{entity_name}.ets", "_generate_entity", False),
+        ("data/repositories/{entity_name}Repository.ets", "_generate_simple_repository", False),
+        ("viewmodels/{entity_name}ViewModel.ets", "_generate_simple_viewmodel", False),
+        ("views/pages/{entity_name}Page.ets", "_generate_page", False),
+    )
     
     def _generate_simple_repository(self) -> str:
         """Gera repositório simples para MVVM"""
-        return f'''// data/repositories/{self.config.entity_name}Repository.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        plural = self.entity_name_plural
+        return f'''// data/repositories/{name}Repository.ets
 
-import {{ {self.config.entity_name} }} from '../models/{self.config.entity_name}';
+import {{ {name} }} from '../models/{name}';
 import {{ ApiService }} from '../datasources/remote/ApiService';
 
-export class {self.config.entity_name}Repository {{
+export class {name}Repository {{
   private apiService: ApiService = new ApiService();
-  private endpoint: string = '/{self.entity_name_lower}s';
+  private endpoint: string = '/{lower}s';
   
-  async get{self.entity_name_plural}(): Promise<{self.config.entity_name}[]> {{
+  async get{plural}(): Promise<{name}[]> {{
     const response = await this.apiService.get<{{ data: Record<string, Object>[] }}>(this.endpoint);
-    return response.data.map(data => {self.config.entity_name}.fromJson(data));
+    return response.data.map(data => {name}.fromJson(data));
   }}
   
-  async get{self.config.entity_name}ById(id: number): Promise<{self.config.entity_name}> {{
+  async get{name}ById(id: number): Promise<{name}> {{
     const response = await this.apiService.get<{{ data: Record<string, Object> }}>(`${{this.endpoint}}/${{id}}`);
-    return {self.config.entity_name}.fromJson(response.data);
+    return {name}.fromJson(response.data);
   }}
   
-  async create{self.config.entity_name}(entity: {self.config.entity_name}): Promise<{self.config.entity_name}> {{
+  async create{name}(entity: {name}): Promise<{name}> {{
     const response = await this.apiService.post<{{ data: Record<string, Object> }}>(
       this.endpoint,
       entity.toJson()
     );
-    return {self.config.entity_name}.fromJson(response.data);
+    return {name}.fromJson(response.data);
   }}
   
-  async update{self.config.entity_name}(entity: {self.config.entity_name}): Promise<{self.config.entity_name}> {{
+  async update{name}(entity: {name}): Promise<{name}> {{
     const response = await this.apiService.put<{{ data: Record<string, Object> }}>(
       `${{this.endpoint}}/${{entity.id}}`,
       entity.toJson()
     );
-    return {self.config.entity_name}.fromJson(response.data);
+    return {name}.fromJson(response.data);
   }}
   
-  async delete{self.config.entity_name}(id: number): Promise<void> {{
+  async delete{name}(id: number): Promise<void> {{
     await this.apiService.delete<void>(`${{this.endpoint}}/${{id}}`);
   }}
 }}'''
     
     def _generate_simple_viewmodel(self) -> str:
         """Gera ViewModel simples para MVVM"""
-        return f'''// viewmodels/{self.config.entity_name}ViewModel.ets
+        name = self.entity_name
+        lower = self.entity_name_lower
+        plural = self.entity_name_plural
+        create_params = self._create_params
+        create_args = self._create_args
+        return f'''// viewmodels/{name}ViewModel.ets
 
 import {{ BaseViewModel }} from './base/BaseViewModel';
-import {{ {self.config.entity_name} }} from '../data/models/{self.config.entity_name}';
-import {{ {self.config.entity_name}Repository }} from '../data/repositories/{self.config.entity_name}Repository';
+import {{ {name} }} from '../data/models/{name}';
+import {{ {name}Repository }} from '../data/repositories/{name}Repository';
 
 @Observed
-export class {self.config.entity_name}ViewModel extends BaseViewModel {{
-  @State {self.entity_name_lower}s: {self.config.entity_name}[] = [];
-  @State selected{self.config.entity_name}: {self.config.entity_name} | null = null;
+export class {name}ViewModel extends BaseViewModel {{
+  @State {lower}s: {name}[] = [];
+  @State selected{name}: {name} | null = null;
   
-  private repository: {self.config.entity_name}Repository = new {self.config.entity_name}Repository();
+  private repository: {name}Repository = new {name}Repository();
   
-  async load{self.entity_name_plural}(): Promise<void> {{
+  async load{plural}(): Promise<void> {{
     await this.executeAsync(
-      () => this.repository.get{self.entity_name_plural}(),
+      () => this.repository.get{plural}(),
       (result) => {{
-        this.{self.entity_name_lower}s = result;
+        this.{lower}s = result;
       }}
     );
   }}
   
-  async create{self.config.entity_name}({self._get_create_params()}): Promise<boolean> {{
+  async create{name}({create_params}): Promise<boolean> {{
     let success = false;
-    const entity = new {self.config.entity_name}(0, {self._get_create_args()});
+    const entity = new {name}(0, {create_args});
     
     await this.executeAsync(
-      () => this.repository.create{self.config.entity_name}(entity),
+      () => this.repository.create{name}(entity),
       (result) => {{
-        this.{self.entity_name_lower}s.push(result);
+        this.{lower}s.push(result);
         success = true;
       }}
     );
     return success;
   }}
   
-  async delete{self.config.entity_name}(id: number): Promise<boolean> {{
+  async delete{name}(id: number): Promise<boolean> {{
     let success = false;
     await this.executeAsync(
-      () => this.repository.delete{self.config.entity_name}(id),
+      () => this.repository.delete{name}(id),
       () => {{
-        this.{self.entity_name_lower}s = this.{self.entity_name_lower}s.filter(e => e.id !== id);
+        this.{lower}s = this.{lower}s.filter(e => e.id !== id);
         success = true;
       }}
     );
@@ -921,96 +1231,7 @@ export class {self.config.entity_name}ViewModel extends BaseViewModel {{
   }}
   
   onDestroy(): void {{
-    this.{self.entity_name_lower}s = [];
-    this.selected{self.config.entity_name} = null;
+    this.{lower}s = [];
+    this.selected{name} = null;
   }}
 }}'''
-    
-    def _generate_simple_page(self) -> str:
-        """Gera página simples para MVVM"""
-        return self._generate_page()
-    
-    # ==========================================
-    # HELPER METHODS
-    # ==========================================
-    
-    def _get_default_value(self, prop: PropertyConfig) -> str:
-        """Retorna valor padrão para propriedade"""
-        if prop.name == 'id':
-            return ' = 0'
-        if prop.optional:
-            return ''
-        
-        if prop.type == 'string':
-            return " = ''"
-        elif prop.type == 'number':
-            return ' = 0'
-        elif prop.type == 'boolean':
-            return ' = false'
-        elif prop.type == 'Date':
-            return ' = new Date()'
-        return ''
-    
-    def _generate_dto_properties(self) -> str:
-        """Gera propriedades do DTO"""
-        lines = []
-        for prop in self.config.properties:
-            optional = '?' if prop.optional else ''
-            dto_type = 'string' if prop.type == 'Date' else prop.type
-            lines.append(f"  {prop.name}{optional}: {dto_type};")
-        return "\n".join(lines)
-    
-    def _generate_to_domain_mapping(self) -> str:
-        """Gera mapeamento DTO -> Domain"""
-        lines = []
-        for prop in self.config.properties:
-            if prop.type == 'Date':
-                lines.append(f"      new Date(dto.{prop.name})")
-            else:
-                lines.append(f"      dto.{prop.name}")
-        return ",\n".join(lines)
-    
-    def _generate_to_dto_mapping(self) -> str:
-        """Gera mapeamento Domain -> DTO"""
-        lines = []
-        for prop in self.config.properties:
-            if prop.type == 'Date':
-                lines.append(f"      {prop.name}: entity.{prop.name}.toISOString()")
-            else:
-                lines.append(f"      {prop.name}: entity.{prop.name}")
-        return ",\n".join(lines)
-    
-    def _get_create_params(self) -> str:
-        """Gera parâmetros para método create"""
-        params = []
-        for prop in self.config.properties:
-            if prop.name == 'id':
-                continue
-            optional = '?' if prop.optional else ''
-            params.append(f"{prop.name}{optional}: {prop.type}")
-        return ", ".join(params)
-    
-    def _get_create_args(self) -> str:
-        """Gera argumentos para método create"""
-        args = []
-        for prop in self.config.properties:
-            if prop.name == 'id':
-                continue
-            args.append(prop.name)
-        return ", ".join(args)
-    
-    def _get_entity_creation(self) -> str:
-        """Gera criação de entidade"""
-        args = []
-        for prop in self.config.properties:
-            if prop.name == 'id':
-                args.append("0")
-            else:
-                args.append(prop.name)
-        return ", ".join(args)
-    
-    def _indent_code(self, text: str, level: int = 1) -> str:
-        """Indenta código"""
-        indent = "  " * level
-        lines = text.split('\n')
-        return '\n'.join(indent + line if line.strip() else line for line in lines)
@@ -9,15 +9,21 @@ from code_generator import (
     GeneratorConfig,
     PropertyConfig,
     ValidationRule,
-    ValidationType
+    REQUIRED,
+    MIN_LENGTH,
+    MAX_LENGTH,
+    EMAIL,
+    MIN,
+    MAX
 )
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 
 def example_clean_architecture_with_validation():
     """Exemplo: Clean Architecture com validações completas"""
-    print("📝 Exemplo 1: Clean Architecture com Validações")
-    
     config = GeneratorConfig(
         entity_name="User",
         properties=[
@@ -26,16 +32,16 @@ def example_clean_architecture_with_validation():
                 name="name",
                 type="string",
                 validation=[
-                    ValidationRule(ValidationType.REQUIRED, message="Nome é obrigatório"),
-                    ValidationRule(ValidationType.MIN_LENGTH, value=3, message="Nome muito curto")
+                    ValidationRule(REQUIRED, message="Nome é obrigatório"),
+                    ValidationRule(MIN_LENGTH, value=3, message="Nome muito curto")
                 ]
             ),
             PropertyConfig(
                 name="email",
                 type="string",
                 validation=[
-                    ValidationRule(ValidationType.REQUIRED),
-                    ValidationRule(ValidationType.EMAIL)
+                    ValidationRule(REQUIRED),
+                    ValidationRule(EMAIL)
                 ]
             ),
             PropertyConfig(
@@ -43,8 +49,8 @@ def example_clean_architecture_with_validation():
                 type="number",
                 optional=True,
                 validation=[
-                    ValidationRule(ValidationType.MIN, value=0),
-                    ValidationRule(ValidationType.MAX, value=150)
+                    ValidationRule(MIN, value=0),
+                    ValidationRule(MAX, value=150)
                 ]
             ),
             PropertyConfig(name="createdAt", type="Date")
@@ -55,19 +61,11 @@ def example_clean_architecture_with_validation():
     )
     
     generator = CodeGenerator(config)
-    files = generator.generate_all()
-    
-    # Salva arquivos
-    output_dir = Path("./examples/user_clean")
-    _save_files(files, output_dir)
-    
-    print(f"✅ {len(files)} arquivos gerados em {output_dir}\n")
+    return Path("./examples/user_clean"), generator.generate_all()
 
 
 def example_mvvm_simple():
     """Exemplo: MVVM Tradicional simples"""
-    print("📝 Exemplo 2: MVVM Tradicional")
-    
     config = GeneratorConfig(
         entity_name="Product",
         properties=[
@@ -84,18 +82,11 @@ def example_mvvm_simple():
     )
     
     generator = CodeGenerator(config)
-    files = generator.generate_all()
-    
-    output_dir = Path("./examples/product_mvvm")
-    _save_files(files, output_dir)
-    
-    print(f"✅ {len(files)} arquivos gerados em {output_dir}\n")
+    return Path("./examples/product_mvvm"), generator.generate_all()
 
 
 def example_blog_post():
     """Exemplo: Entidade BlogPost com Clean Architecture"""
-    print("📝 Exemplo 3: BlogPost (Clean Architecture)")
-    
     config = GeneratorConfig(
         entity_name="BlogPost",
         properties=[
@@ -104,9 +95,9 @@ def example_blog_post():
                 name="title",
                 type="string",
                 validation=[
-                    ValidationRule(ValidationType.REQUIRED),
-                    ValidationRule(ValidationType.MIN_LENGTH, value=5),
-                    ValidationRule(ValidationType.MAX_LENGTH, value=200)
+                    ValidationRule(REQUIRED),
+                    ValidationRule(MIN_LENGTH, value=5),
+                    ValidationRule(MAX_LENGTH, value=200)
                 ]
             ),
             PropertyConfig(name="content", type="string"),
@@ -122,18 +113,11 @@ def example_blog_post():
     )
     
     generator = CodeGenerator(config)
-    files = generator.generate_all()
-    
-    output_dir = Path("./examples/blogpost_clean")
-    _save_files(files, output_dir)
-    
-    print(f"✅ {len(files)} arquivos gerados em {output_dir}\n")
+    return Path("./examples/blogpost_clean"), generator.generate_all()
 
 
 def example_minimal():
     """Exemplo: Entidade mínima"""
-    print("📝 Exemplo 4: Entidade Mínima")
-    
     config = GeneratorConfig(
         entity_name="Category",
         properties=[
@@ -144,20 +128,42 @@ def example_minimal():
     )
     
     generator = CodeGenerator(config)
-    files = generator.generate_all()
-    
-    output_dir = Path("./examples/category_minimal")
-    _save_files(files, output_dir)
-    
-    print(f"✅ {len(files)} arquivos gerados em {output_dir}\n")
+    return Path("./examples/category_minimal"), generator.generate_all()
+
+
+# Exemplos executados pelo script: (título, função que retorna (diretório, arquivos))
+_EXAMPLES = [
+    ("📝 Exemplo 1: Clean Architecture com Validações", example_clean_architecture_with_validation),
+    ("📝 Exemplo 2: MVVM Tradicional", example_mvvm_simple),
+    ("📝 Exemplo 3: BlogPost (Clean Architecture)", example_blog_post),
+    ("📝 Exemplo 4: Entidade Mínima", example_minimal),
+]
+
+
+# Abaixo disto, criar o pool de threads custa mais do que as escritas que
+# ele paraleliza; cobre todos os exemplos (no máximo 15 arquivos)
+_PARALLEL_WRITE_MIN_FILES = 16
 
 
 def _save_files(files: dict, output_dir: Path):
     """Salva arquivos no diretório especificado"""
-    for file_path, content in files.items():
-        full_path = output_dir / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding='utf-8')
+    paths = {output_dir / file_path: content for file_path, content in files.items()}
+    
+    # Cada diretório é criado uma única vez
+    for directory in {path.parent for path in paths}:
+        directory.mkdir(parents=True, exist_ok=True)
+    
+    if len(paths) < _PARALLEL_WRITE_MIN_FILES:
+        for path, content in paths.items():
+            path.write_bytes(content.encode('utf-8'))
+        return
+    
+    # As escritas liberam o GIL, então rodam em paralelo
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(
+            lambda item: item[0].write_bytes(item[1].encode('utf-8')),
+            paths.items()
+        ))
 
 
 def list_generated_files():
@@ -168,12 +174,22 @@ def list_generated_files():
     
     examples_dir = Path("./examples")
     if examples_dir.exists():
-        for example_dir in sorted(examples_dir.iterdir()):
-            if example_dir.is_dir():
-                print(f"\n📁 {example_dir.name}/")
-                for file in sorted(example_dir.rglob("*.ets")):
-                    rel_path = file.relative_to(example_dir)
-                    print(f"  ├─ {rel_path}")
+        # Uma única varredura da árvore; os arquivos .ets são agrupados pelo
+        # diretório de exemplo e guardados como partes do caminho relativo
+        generated: Dict[str, List[Tuple[str, ...]]] = {}
+        for root, dirs, files in os.walk(examples_dir):
+            rel_root = os.path.relpath(root, examples_dir)
+            if rel_root == os.curdir:
+                generated = {name: [] for name in dirs}
+                continue
+            example, _, subdir = rel_root.partition(os.sep)
+            prefix = tuple(subdir.split(os.sep)) if subdir else ()
+            generated[example].extend(prefix + (name,) for name in files if name.endswith(".ets"))
+        
+        for example in sorted(generated):
+            print(f"\n📁 {example}/")
+            for parts in sorted(generated[example]):
+                print(f"  ├─ {os.path.join(*parts)}")
 
 
 if __name__ == "__main__":
@@ -181,10 +197,14 @@ if __name__ == "__main__":
     print("🚀 Exemplos de Geração de Código ArkTS")
     print("="*60 + "\n")
     
-    example_clean_architecture_with_validation()
-    example_mvvm_simple()
-    example_blog_post()
-    example_minimal()
+    # Os exemplos rodam em sequência no mesmo processo: são pequenos demais
+    # para compensar um pool de processos, e assim compartilham o cache de
+    # generate_all
+    for title, example in _EXAMPLES:
+        print(title)
+        output_dir, files = example()
+        _save_files(files, output_dir)
+        print(f"✅ {len(files)} arquivos gerados em {output_dir}\n")
     
     list_generated_files()
     
@@ -0,0 +1,88 @@
+# test_code_generator.py
+
+"""
+Testes de regressão do Code Generator ArkTS (python -m unittest)
+"""
+
+import copy
+import pickle
+import unittest
+
+from code_generator import (
+    CleanCodeGenerator,
+    CodeGenerator,
+    MvvmCodeGenerator,
+    GeneratorConfig,
+    PropertyConfig,
+    ValidationRule,
+    MIN
+)
+
+
+def _age_config(min_value) -> GeneratorConfig:
+    """Configuração com uma única regra MIN sobre a idade"""
+    return GeneratorConfig(
+        entity_name="Person",
+        properties=[
+            PropertyConfig(name="id", type="number"),
+            PropertyConfig(name="age", type="number", validation=[ValidationRule(MIN, value=min_value)])
+        ],
+        include_validation=True
+    )
+
+
+class GenerateAllCacheTest(unittest.TestCase):
+    """Cache de generate_all entre configurações equivalentes"""
+
+    def test_numerically_equal_rule_values_do_not_share_cache(self):
+        """0 e 0.0 são iguais para o Python, mas geram código diferente"""
+        first = CodeGenerator(_age_config(0)).generate_all()
+        self.assertIn("if (this.age < 0) {", first["domain/entities/Person.ets"])
+
+        generator = CodeGenerator(_age_config(0.0))
+        second = generator.generate_all()
+        self.assertIn("if (this.age < 0.0) {", second["domain/entities/Person.ets"])
+        self.assertEqual(second, dict(generator.iter_files()))
+
+    def test_config_changed_after_construction_does_not_poison_cache(self):
+        """A saída de um gerador cujo config mudou não chega a geradores novos"""
+        config = _age_config(0)
+        stale = CodeGenerator(config)
+        config.entity_name = "Order"
+        config.properties.append(PropertyConfig(name="total", type="number"))
+        stale.generate_all()
+        
+        order = _age_config(0)
+        order.entity_name = "Order"
+        order.properties.append(PropertyConfig(name="total", type="number"))
+        files = CodeGenerator(order).generate_all()
+        self.assertIn("data/repositories/OrderRepositoryImpl.ets", files)
+        self.assertNotIn("data/repositories/PersonRepositoryImpl.ets", files)
+        self.assertIn("total: number", files["domain/usecases/order/CreateOrderUseCase.ets"])
+
+
+class CodeGeneratorFactoryTest(unittest.TestCase):
+    """Escolha da subclasse por arquitetura em CodeGenerator.__new__"""
+
+    def test_copy_and_pickle_keep_the_subclass(self):
+        generator = CodeGenerator(_age_config(0))
+        self.assertIsInstance(generator, CleanCodeGenerator)
+        for clone in (copy.copy(generator), pickle.loads(pickle.dumps(generator))):
+            self.assertIs(type(clone), CleanCodeGenerator)
+            self.assertEqual(clone.generate_all(), generator.generate_all())
+
+    
+    def test_subclass_with_other_architecture_does_not_share_cache(self):
+        """Arquivos da Clean gerados para um config MVVM não voltam para o MVVM"""
+        config = _age_config(0)
+        config.architecture = 'mvvm'
+        clean_files = CleanCodeGenerator(config).generate_all()
+        self.assertEqual(len(clean_files), 13)
+        
+        generator = CodeGenerator(config)
+        self.assertIsInstance(generator, MvvmCodeGenerator)
+        self.assertEqual(sorted(generator.generate_all()), sorted(path for path, _ in generator.iter_files()))
+
+
+if __name__ == "__main__":
+    unittest.main()